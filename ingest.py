@@ -4,16 +4,33 @@ from __future__ import annotations
 import argparse
 import hashlib
 import os
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from functools import partial
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, TypeVar
 
-import pandas as pd  # type: ignore[import-untyped]
-import yaml  # type: ignore[import-untyped]
-
-from radar import sources, extract, geocode, dedupe, store, export
+from radar import (
+    sources,
+    extract,
+    geocode,
+    dedupe,
+    store,
+    export,
+    daemon,
+    cluster,
+    retention,
+    shard,
+    workqueue,
+    textcache,
+)
 
 
 def load_config(path: str) -> Dict[str, Any]:
+    import yaml  # type: ignore[import-untyped]
+
     with open(path, "r", encoding="utf-8") as f:
         raw = yaml.safe_load(f)
     # Allow env-var overrides for secrets
@@ -29,86 +46,500 @@ def _event_uid(item: sources.Item) -> str:
     return hashlib.sha256(basis.encode()).hexdigest()[:32]
 
 
-def pull_sources(cfg: Dict[str, Any]) -> List[sources.Item]:
-    items: List[sources.Item] = []
-    rss_urls = cfg.get("sources", {}).get("rss", [])
-    # Allow runtime URL injection from env
-    flight_url = cfg.get("flight_data_url")
-    permit_url = cfg.get("permit_data_url")
-    items.extend(sources.fetch_rss(rss_urls))
-    for url in cfg.get("sources", {}).get("json", []):
-        items.extend(sources.fetch_json(url))
-    if flight_url:
-        items.extend(sources.fetch_json(flight_url))
-    if permit_url:
-        items.extend(sources.fetch_json(permit_url))
-    return items
+def feed_specs(cfg: Dict[str, Any]) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """Return ``(kind, url, options)`` for every configured feed.
 
+    JSON sources may be plain URLs or mappings with a ``url`` plus
+    :func:`radar.sources.iter_json` options (``fields``, ``items_path`` ...).
+    """
+    specs: List[Tuple[str, str, Dict[str, Any]]] = [
+        ("rss", url, {}) for url in cfg.get("sources", {}).get("rss", [])
+    ]
+    for entry in cfg.get("sources", {}).get("json", []):
+        if isinstance(entry, dict):
+            opts = dict(entry)
+            specs.append(("json", opts.pop("url"), opts))
+        else:
+            specs.append(("json", entry, {}))
+    # Allow runtime URL injection from env; options live under flight_data / permit_data
+    for name in ("flight_data", "permit_data"):
+        if cfg.get(f"{name}_url"):
+            specs.append(("json", cfg[f"{name}_url"], dict(cfg.get(name) or {})))
+    return specs
 
-def process_items(
-    items: List[sources.Item], cfg: Dict[str, Any], since: datetime | None
-) -> List[Dict[str, Any]]:
-    geocoder = geocode.GeoCoder(cfg.get("geocode_cache", "data/geocode_cache.sqlite"))
-    events: List[Dict[str, Any]] = []
+
+def pull_feed(
+    kind: str, url: str, options: Dict[str, Any] | None = None, strict: bool = False
+) -> Iterable[sources.Item]:
+    if kind == "rss":
+        return sources.fetch_rss([url], strict=strict)
+    return sources.iter_json(url, **(options or {}), strict=strict)
+
+
+def pull_sources(cfg: Dict[str, Any]) -> Iterator[sources.Item]:
+    return chain.from_iterable(pull_feed(*spec) for spec in feed_specs(cfg))
+
+
+class _Counted:
+    """Iterates ``items`` once while counting them."""
+
+    def __init__(self, items: Iterable[sources.Item]):
+        self.items = items
+        self.count = 0
+
+    def __iter__(self) -> Iterator[sources.Item]:
+        for item in self.items:
+            self.count += 1
+            yield item
+
+
+T = TypeVar("T")
+
+
+def _batched(rows: Iterable[T], size: int) -> Iterator[List[T]]:
+    it = iter(rows)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def open_text_cache(cfg: Dict[str, Any]) -> textcache.TextCache | None:
+    opts = cfg.get("extraction") or {}
+    if not opts.get("cache_dir"):
+        return None
+    return textcache.TextCache(opts["cache_dir"], int(float(opts.get("cache_max_mb", 200)) * 1024 * 1024))
+
+
+def _article_text(item: sources.Item, text_cache: textcache.TextCache | None, strict: bool = False) -> str:
+    fetch = partial(sources.fetch_article_html, strict=True) if strict else sources.fetch_article_html
+    if text_cache is not None and item.link:
+        return text_cache.get_or_fetch(item.link, fetch)
+    return fetch(item.link)
+
+
+def extract_stage(
+    item: sources.Item,
+    tiered: bool = False,
+    text_cache: textcache.TextCache | None = None,
+    strict: bool = False,
+    default_time: datetime | None = None,
+) -> Dict[str, Any]:
+    """Article download, NER, time and type extraction for one item.
+
+    In tiered mode the title and summary are tried first and the article is
+    only fetched when they name no GPE/LOC entity. With ``strict`` a transient
+    download failure raises instead of falling back to the summary. Undated items get
+    ``default_time`` (else the current time).
+    """
+    candidates: List[extract.Candidate] = []
+    if item.lat is None or item.lon is None:
+        if tiered:
+            candidates = extract.extract_locations(item.summary, item.title)
+        if not candidates:
+            text = _article_text(item, text_cache, strict) or item.summary
+            candidates = extract.extract_candidates(text, item.title)
+    location_text = candidates[0].text if candidates else ""
+    return {
+        "location_text": location_text,
+        "event_time": extract.extract_event_time(item.published or item.summary, default_time),
+        "event_type": extract.classify_event_type(f"{item.title} {item.summary}"),
+        "simhash": dedupe.simhash_of(item.title + item.summary),
+    }
+
+
+def geocode_stage(
+    item: sources.Item, extracted: Dict[str, Any], geocoder: geocode.GeoCoder, strict: bool = False
+) -> Dict[str, Any]:
+    """Resolve coordinates and build the final event row; ``strict`` raises geocoder errors."""
+    if item.lat is not None and item.lon is not None:
+        lat, lon, confidence = item.lat, item.lon, 1.0
+    elif extracted["location_text"]:
+        lookup = partial(geocoder.geocode, strict=True) if strict else geocoder.geocode
+        lat, lon, confidence = lookup(extracted["location_text"])
+    else:
+        lat, lon, confidence = None, None, None
+    return {
+        "event_uid": _event_uid(item),
+        "source": item.source,
+        "title": item.title,
+        "link": item.link,
+        "summary": item.summary,
+        "event_time": extracted["event_time"],
+        "lat": lat,
+        "lon": lon,
+        "event_type": extracted["event_type"],
+        "city": None,
+        "state": None,
+        "country": None,
+        "confidence": confidence,
+        "simhash": extracted["simhash"],
+    }
+
+
+def _skip_reason(extracted: Dict[str, Any], since: datetime | None, dedupe_items: bool) -> str | None:
+    if since and extracted["event_time"] < since:
+        return "before --since"
+    if dedupe_items and dedupe.is_dupe(extracted["simhash"], window_hours=24):
+        return "duplicate"
+    return None
+
+
+def iter_events(
+    items: Iterable[sources.Item],
+    cfg: Dict[str, Any],
+    since: datetime | None,
+    geocoder: geocode.GeoCoder | None = None,
+    dedupe_items: bool = True,
+    text_cache: textcache.TextCache | None = None,
+    default_time: datetime | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """Lazily turn items into event rows, one at a time."""
+    if geocoder is None:
+        geocoder = geocode.GeoCoder(cfg.get("geocode_cache", "data/geocode_cache.sqlite"))
+    if text_cache is None:
+        text_cache = open_text_cache(cfg)
+    tiered = bool((cfg.get("extraction") or {}).get("tiered"))
     for item in items:
-        text = sources.fetch_article_html(item.link) or item.summary
-        candidates = extract.extract_candidates(text, item.title)
-        location_text = candidates[0].text if candidates else ""
-        event_time = extract.extract_event_time(item.published or item.summary)
-        if since and event_time < since:
+        extracted = extract_stage(item, tiered, text_cache, default_time=default_time)
+        if _skip_reason(extracted, since, dedupe_items):
             continue
-        event_type = extract.classify_event_type(f"{item.title} {item.summary}")
-        simhash_val = dedupe.simhash_of(item.title + item.summary)
-        if dedupe.is_dupe(simhash_val, window_hours=24):
+        yield geocode_stage(item, extracted, geocoder)
+
+
+def process_items(
+    items: Iterable[sources.Item],
+    cfg: Dict[str, Any],
+    since: datetime | None,
+    geocoder: geocode.GeoCoder | None = None,
+    dedupe_items: bool = True,
+    text_cache: textcache.TextCache | None = None,
+    default_time: datetime | None = None,
+) -> List[Dict[str, Any]]:
+    return list(iter_events(items, cfg, since, geocoder, dedupe_items, text_cache, default_time))
+
+
+def iter_queue(
+    queue: workqueue.WorkQueue,
+    cfg: Dict[str, Any],
+    since: datetime | None,
+    geocoder: geocode.GeoCoder | None = None,
+    text_cache: textcache.TextCache | None = None,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Run due queue items through the remaining stages, checkpointing after each.
+
+    Transient download and geocoder errors are raised in strict mode so they
+    are recorded as failures and retried, rather than stored as empty results;
+    a dead article link falls back to the summary as in :func:`iter_events`.
+    Items older than ``since`` are held for a later run; only duplicates are
+    finished without writing. Yields ``(uid, event)`` pairs ready to write.
+    """
+    if geocoder is None:
+        geocoder = geocode.GeoCoder(cfg.get("geocode_cache", "data/geocode_cache.sqlite"))
+    if text_cache is None:
+        text_cache = open_text_cache(cfg)
+    tiered = bool((cfg.get("extraction") or {}).get("tiered"))
+    for uid, item, stage, result in queue.due():
+        try:
+            if stage == "queued":
+                result = extract_stage(item, tiered, text_cache, strict=True)
+                queue.advance(uid, "extracted", result)
+                stage = "extracted"
+            if stage == "extracted":
+                if since and result["event_time"] < since:
+                    queue.hold(uid)
+                    continue
+                duplicate_of = queue.claim(uid, result["simhash"], window_hours=24)
+                if duplicate_of:
+                    queue.skip(uid, f"duplicate of {duplicate_of}")
+                    continue
+                result = geocode_stage(item, result, geocoder, strict=True)
+                queue.advance(uid, "geocoded", result)
+        except Exception as exc:
+            if queue.fail(uid, repr(exc)) == "parked":
+                print(f"Parked {item.link or uid} after repeated failures: {exc!r}")
             continue
-        lat, lon, confidence = geocoder.geocode(location_text) if location_text else (None, None, None)
-        events.append(
-            {
-                "event_uid": _event_uid(item),
-                "source": item.source,
-                "title": item.title,
-                "link": item.link,
-                "summary": item.summary,
-                "event_time": event_time,
-                "lat": lat,
-                "lon": lon,
-                "event_type": event_type,
-                "city": None,
-                "state": None,
-                "country": None,
-                "confidence": confidence,
-                "simhash": simhash_val,
-            }
-        )
-    return events
+        yield uid, result
 
 
-def run_pipeline(cfg: Dict[str, Any], dry_run: bool, since: datetime | None) -> None:
-    items = pull_sources(cfg)
-    events = process_items(items, cfg, since)
-    if dry_run:
-        print(f"Pulled {len(items)} items, {len(events)} events (dry run — nothing written)")
-        return
+def process_queue(
+    queue: workqueue.WorkQueue,
+    cfg: Dict[str, Any],
+    since: datetime | None,
+    geocoder: geocode.GeoCoder | None = None,
+    text_cache: textcache.TextCache | None = None,
+) -> Tuple[List[str], List[Dict[str, Any]]]:
+    pairs = list(iter_queue(queue, cfg, since, geocoder, text_cache))
+    return [uid for uid, _ in pairs], [event for _, event in pairs]
+
 
+def open_stores(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Open the configured backend connections (PostGIS, or DuckDB + SQLite)."""
     postgis_dsn = cfg.get("postgis_dsn")
     if postgis_dsn:
         from radar import pg_store
         pg_conn = pg_store.connect(postgis_dsn)
         pg_store.ensure_schema(pg_conn)
-        written = pg_store.upsert_events(pg_conn, events)
-        pg_conn.close()
+        return {"pg": pg_conn}
+    return {
+        "duck": store.connect_duckdb(cfg["duckdb_path"]),
+        "sqlite": store.connect_sqlite(cfg["sqlite_path"]),
+    }
+
+
+def close_stores(stores: Dict[str, Any]) -> None:
+    for conn in stores.values():
+        conn.close()
+
+
+def write_events(cfg: Dict[str, Any], events: List[Dict[str, Any]], stores: Dict[str, Any]) -> None:
+    store_events(cfg, events, stores)
+    finalize_events(cfg, stores)
+
+
+def store_events(cfg: Dict[str, Any], events: List[Dict[str, Any]], stores: Dict[str, Any]) -> None:
+    """Insert one batch of events, cluster them and record their articles."""
+    if "pg" in stores:
+        from radar import pg_store
+        written = pg_store.upsert_events(stores["pg"], events)
+        cluster.cluster_new_events(stores["pg"], pg_store, **(cfg.get("clustering") or {}))
         print(f"Upserted {written} events into PostGIS")
-    else:
-        duck = store.connect_duckdb(cfg["duckdb_path"])
-        sqlite_conn = store.connect_sqlite(cfg["sqlite_path"])
-        uids = store.insert_events(duck, events)
-        for uid, ev in zip(uids, events):
-            store.upsert_article(sqlite_conn, uid, ev["title"], ev["summary"])
-            if cfg.get("vault_path"):
-                export.to_obsidian_note(pd.Series(ev | {"id": uid}), cfg["vault_path"])
-        df = duck.execute("SELECT * FROM events").fetchdf()
-        export.to_geojson(df, cfg["geojson_output"])
-        export.to_csv(df, cfg["csv_output"])
+        return
+    import pandas as pd  # type: ignore[import-untyped]
+
+    duck, sqlite_conn = stores["duck"], stores["sqlite"]
+    inserted = set(store.insert_events(duck, events))
+    cluster.cluster_new_events(duck, store, **(cfg.get("clustering") or {}))
+    for ev in events:
+        uid = ev["event_uid"]
+        if uid not in inserted:
+            continue
+        store.upsert_article(sqlite_conn, uid, ev["title"], ev["summary"])
+        if cfg.get("vault_path"):
+            export.to_obsidian_note(pd.Series(ev | {"id": uid}), cfg["vault_path"])
+
+
+def finalize_events(cfg: Dict[str, Any], stores: Dict[str, Any]) -> None:
+    """Archive and export once all batches of a run are stored."""
+    if "duck" not in stores:
+        return
+    duck = stores["duck"]
+    archive_old_events(cfg, stores)
+    df = duck.execute("SELECT * FROM events").fetchdf()
+    export.to_geojson(df, cfg["geojson_output"])
+    export.to_csv(df, cfg["csv_output"])
+
+
+def archive_old_events(cfg: Dict[str, Any], stores: Dict[str, Any], vacuum_free_ratio: float | None = None) -> int:
+    """Move events past ``retention.horizon_days`` from the DuckDB hot table to Parquet."""
+    opts = cfg.get("retention") or {}
+    if not opts.get("horizon_days") or "duck" not in stores:
+        return 0
+    moved = retention.archive_events(
+        stores["duck"],
+        opts.get("archive_dir", "data/archive"),
+        float(opts["horizon_days"]),
+        stores["sqlite"],
+        vacuum_free_ratio=(
+            float(opts.get("vacuum_free_ratio", 0.25)) if vacuum_free_ratio is None else vacuum_free_ratio
+        ),
+    )
+    if moved:
+        print(f"Archived {moved} events older than {opts['horizon_days']} days")
+    return moved
+
+
+def run_queued_pipeline(cfg: Dict[str, Any], since: datetime | None) -> None:
+    """Like :func:`run_pipeline`, but every item's progress survives a crash or kill."""
+    opts = cfg["work_queue"]
+    queue = workqueue.WorkQueue(
+        opts.get("path", "data/work_queue.sqlite"),
+        max_attempts=int(opts.get("max_attempts", 5)),
+        backoff_seconds=float(opts.get("backoff_seconds", 60)),
+    )
+    try:
+        added = queue.enqueue((_event_uid(item), item) for item in pull_sources(cfg))
+        written = 0
+        stores = open_stores(cfg)
+        try:
+            for batch in _batched(iter_queue(queue, cfg, since), int(cfg.get("write_batch_size", 500))):
+                store_events(cfg, [event for _, event in batch], stores)
+                queue.finish(uid for uid, _ in batch)
+                written += len(batch)
+            finalize_events(cfg, stores)
+        finally:
+            close_stores(stores)
+        queue.prune(float(opts.get("keep_days", 7)))
+        print(f"Queued {added} new items, wrote {written} events; queue status {queue.counts()}")
+    finally:
+        queue.close()
+
+
+def run_pipeline(cfg: Dict[str, Any], dry_run: bool, since: datetime | None) -> None:
+    if cfg.get("work_queue") and not dry_run:
+        run_queued_pipeline(cfg, since)
+        return
+    items = _Counted(pull_sources(cfg))
+    events = iter_events(items, cfg, since)
+    if dry_run:
+        kept = sum(1 for _ in events)
+        print(f"Pulled {items.count} items, {kept} events (dry run — nothing written)")
+        return
+    stores = open_stores(cfg)
+    try:
+        for batch in _batched(events, int(cfg.get("write_batch_size", 500))):
+            store_events(cfg, batch, stores)
+        finalize_events(cfg, stores)
+    finally:
+        close_stores(stores)
+
+
+def run_shard(
+    cfg: Dict[str, Any],
+    index: int,
+    count: int,
+    staging_dir: str,
+    since: datetime | None = None,
+    run_time: datetime | None = None,
+) -> str:
+    """Fetch/extract/geocode one shard of the sources into its own staging file.
+
+    Simhash dedupe is left to :func:`merge_shards` so the merged result does
+    not depend on how sources were split. Undated items are stamped with
+    ``run_time``, which every shard of a run must share for the same reason.
+    """
+    specs = shard.select_shard(feed_specs(cfg), index, count)
+    items = chain.from_iterable(pull_feed(*spec) for spec in specs)
+    events = process_items(items, cfg, since, dedupe_items=False, default_time=run_time or datetime.now(timezone.utc))
+    path = shard.write_staging(events, shard.staging_path(staging_dir, index, count))
+    print(f"Shard {index}/{count}: {len(specs)} sources, {len(events)} events -> {path}")
+    return str(path)
+
+
+def merge_shards(cfg: Dict[str, Any], staging_dir: str, dry_run: bool = False) -> List[Dict[str, Any]]:
+    """Merge every shard's staging file into the store and consume the files."""
+    files = shard.staged_files(staging_dir)
+    events = shard.merge_events(shard.read_staging(files))
+    if dry_run:
+        print(f"Merged {len(files)} shards into {len(events)} events (dry run — nothing written)")
+        return events
+    stores = open_stores(cfg)
+    try:
+        write_events(cfg, events, stores)
+    finally:
+        close_stores(stores)
+    for path in files:
+        path.unlink()
+    return events
+
+
+def run_sharded(
+    cfg: Dict[str, Any], workers: int, staging_dir: str, dry_run: bool, since: datetime | None
+) -> None:
+    """Run ``workers`` shards in local processes, then merge them."""
+    shard.clear_staging(staging_dir)
+    run_time = datetime.now(timezone.utc)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_shard, cfg, i, workers, staging_dir, since, run_time) for i in range(workers)
+        ]
+        for future in futures:
+            future.result()
+    merge_shards(cfg, staging_dir, dry_run)
+
+
+def poll_feed(
+    feed: daemon.Feed,
+    cfg: Dict[str, Any],
+    since: datetime | None = None,
+    geocoder: geocode.GeoCoder | None = None,
+    text_cache: textcache.TextCache | None = None,
+) -> List[str]:
+    """One daemon poll: process only items not returned by the feed's last poll.
+
+    The stores are opened only while new events are written, so the dashboard
+    and other CLI runs can use the database between polls. Archiving and
+    export are left to :func:`finalize_events` on the daemon's own timer.
+    Returns the uids of everything the feed currently publishes. When the
+    fetch fails part-way, the items read so far are still written and the
+    previous uids are kept, so the missing tail is not treated as new later.
+    """
+    uids: List[str] = []
+    truncated: List[Exception] = []
+
+    def unseen(items: Iterable[sources.Item]) -> Iterator[sources.Item]:
+        try:
+            for item in items:
+                uid = _event_uid(item)
+                uids.append(uid)
+                if uid not in feed.seen:
+                    yield item
+        except Exception as exc:
+            truncated.append(exc)
+
+    items = unseen(pull_feed(feed.kind, feed.url, feed.options, strict=True))
+    events = process_items(items, cfg, since, geocoder=geocoder, text_cache=text_cache)
+    if events:
+        stores = open_stores(cfg)
+        try:
+            store_events(cfg, events, stores)
+        finally:
+            close_stores(stores)
+    if truncated:
+        print(f"Incomplete poll of {feed.url}: {truncated[0]!r}")
+        return list(feed.seen.union(uids))
+    return uids
+
+
+def run_daemon(cfg: Dict[str, Any], since: datetime | None = None) -> None:
+    """Poll feeds forever, keeping models, caches and dedupe state warm.
+
+    Database connections are opened per write; archiving and export run every
+    ``daemon.finalize_interval`` seconds, and only after something was written.
+    """
+    opts = cfg.get("daemon") or {}
+    min_interval = float(opts.get("min_interval", 60))
+    max_interval = float(opts.get("max_interval", 3600))
+    initial = float(opts.get("initial_interval", min_interval))
+    geocoder = geocode.GeoCoder(cfg.get("geocode_cache", "data/geocode_cache.sqlite"))
+    text_cache = open_text_cache(cfg)
+    extract.load_spacy()
+    dirty = threading.Event()
+
+    def poll(feed: daemon.Feed) -> List[str]:
+        uids = poll_feed(feed, cfg, since, geocoder, text_cache)
+        if not feed.seen.issuperset(uids):
+            dirty.set()
+        return uids
+
+    def finalize() -> None:
+        if not dirty.is_set():
+            return
+        dirty.clear()
+        stores = open_stores(cfg)
+        try:
+            finalize_events(cfg, stores)
+        finally:
+            close_stores(stores)
+
+    scheduler = daemon.Scheduler(
+        (daemon.Feed(kind, url, initial, options=options) for kind, url, options in feed_specs(cfg)),
+        poll,
+        min_interval=min_interval,
+        max_interval=max_interval,
+    )
+    scheduler.every(float(opts.get("finalize_interval", 600)), finalize)
+    host = opts.get("host", daemon.DEFAULT_HOST)
+    port = int(opts.get("port", daemon.DEFAULT_PORT))
+    httpd = daemon.start_trigger_server(scheduler, host, port)
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: (stop.set(), scheduler.wake()))
+    print(f"Daemon polling {len(scheduler.feeds)} feeds; trigger at http://{host}:{port}/trigger")
+    try:
+        scheduler.serve_forever(stop)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.shutdown()
+        finalize()
 
 
 def parse_args() -> argparse.Namespace:
@@ -117,17 +548,49 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--dry-run", action="store_true")
     p.add_argument("--since")
     p.add_argument("--update", action="store_true", help="Run update pipeline")
+    p.add_argument("--daemon", action="store_true", help="Keep running and poll feeds on adaptive intervals")
+    p.add_argument("--archive", action="store_true", help="Only archive events past the retention horizon")
+    p.add_argument("--shards", type=int, help="Split sources across N local worker processes")
+    p.add_argument("--shard-index", type=int, help="Run only this shard (with --shard-count) and stage its results")
+    p.add_argument("--shard-count", type=int, help="Total shards when running a single --shard-index")
+    p.add_argument("--run-time", help="ISO timestamp for undated items; give every --shard-index of a run the same one")
+    p.add_argument("--merge", action="store_true", help="Merge staged shard results into the store")
+    p.add_argument("--staging-dir", help="Directory for shard staging files (default: staging_dir in config)")
     return p.parse_args()
 
 
+def _parse_utc(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
 def main() -> None:
     args = parse_args()
     cfg = load_config(args.config)
-    since: datetime | None = None
-    if args.since:
-        since = datetime.fromisoformat(args.since)
-        if since.tzinfo is None:
-            since = since.replace(tzinfo=timezone.utc)
+    since = _parse_utc(args.since) if args.since else None
+    if args.daemon:
+        run_daemon(cfg, since)
+        return
+    staging_dir = args.staging_dir or cfg.get("staging_dir", "data/staging")
+    if args.shard_index is not None:
+        if not args.shard_count or not 0 <= args.shard_index < args.shard_count:
+            raise SystemExit("--shard-index needs --shard-count greater than the index")
+        run_time = _parse_utc(args.run_time) if args.run_time else None
+        run_shard(cfg, args.shard_index, args.shard_count, staging_dir, since, run_time)
+        return
+    if args.merge:
+        merge_shards(cfg, staging_dir, args.dry_run)
+        return
+    if args.shards:
+        run_sharded(cfg, args.shards, staging_dir, args.dry_run, since)
+        return
+    if args.archive:
+        stores = open_stores(cfg)
+        try:
+            archive_old_events(cfg, stores, vacuum_free_ratio=0.0)  # explicit runs always compact
+        finally:
+            close_stores(stores)
+        return
     run_pipeline(cfg, args.dry_run, since)
 
 
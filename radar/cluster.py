@@ -0,0 +1,108 @@
+"""Spatio-temporal incident clustering over stored events."""
+from __future__ import annotations
+
+from datetime import timedelta
+import math
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Tuple
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEG_LAT = 111.32
+
+Cell = Tuple[str, int, int]
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class GridIndex:
+    """Buckets events by ``(event_type, lat cell, lon cell)`` for near-linear neighbour search.
+
+    Cells are ``radius_km`` tall; the longitude span searched widens with
+    latitude so every event within the radius is reached.
+    """
+
+    def __init__(self, radius_km: float):
+        self.radius_km = radius_km
+        self.cell_deg = radius_km / KM_PER_DEG_LAT
+        self.cells: Dict[Cell, List[Dict[str, Any]]] = {}
+
+    def _cell(self, event_type: str, lat: float, lon: float) -> Cell:
+        return (event_type, math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg))
+
+    def add(self, row: Dict[str, Any]) -> None:
+        key = self._cell(row["event_type"], row["lat"], row["lon"])
+        self.cells.setdefault(key, []).append(row)
+
+    def neighbours(self, event_type: str, lat: float, lon: float) -> Iterable[Dict[str, Any]]:
+        etype, ci, cj = self._cell(event_type, lat, lon)
+        lon_span = math.ceil(1 / max(math.cos(math.radians(lat)), 0.01))
+        for di in (-1, 0, 1):
+            for dj in range(-lon_span, lon_span + 1):
+                yield from self.cells.get((etype, ci + di, cj + dj), ())
+
+
+def _locatable(row: Dict[str, Any]) -> bool:
+    return row.get("lat") is not None and row.get("lon") is not None and row.get("event_time") is not None
+
+
+def assign_incidents(
+    new_rows: Iterable[Dict[str, Any]],
+    clustered_rows: Iterable[Dict[str, Any]],
+    radius_km: float = 2.0,
+    window_hours: float = 6.0,
+) -> Dict[str, str]:
+    """Map each new ``event_uid`` to an ``incident_id``.
+
+    A new event joins the incident of its nearest already-clustered neighbour
+    with the same ``event_type`` within ``radius_km`` and ``window_hours``;
+    otherwise it starts an incident named after its own ``event_uid``. New
+    events are visited in ``(event_time, event_uid)`` order so ids are stable
+    across runs, and existing assignments are never rewritten.
+    """
+    window = timedelta(hours=window_hours)
+    index = GridIndex(radius_km)
+    for row in clustered_rows:
+        if _locatable(row):
+            index.add(row)
+
+    assignments: Dict[str, str] = {}
+    ordered = sorted(
+        new_rows, key=lambda r: (r.get("event_time") is None, r.get("event_time") or 0, r["event_uid"])
+    )
+    for row in ordered:
+        incident_id = row["event_uid"]
+        if _locatable(row):
+            best: Tuple[float, str] | None = None
+            for other in index.neighbours(row["event_type"], row["lat"], row["lon"]):
+                if abs(other["event_time"] - row["event_time"]) > window:
+                    continue
+                dist = haversine_km(row["lat"], row["lon"], other["lat"], other["lon"])
+                if dist <= radius_km and (best is None or (dist, other["incident_id"]) < best):
+                    best = (dist, other["incident_id"])
+            if best is not None:
+                incident_id = best[1]
+            index.add(row | {"incident_id": incident_id})
+        assignments[row["event_uid"]] = incident_id
+    return assignments
+
+
+def cluster_new_events(conn: Any, backend: ModuleType, radius_km: float = 2.0, window_hours: float = 6.0) -> int:
+    """Assign incidents to events that have none yet; returns the number assigned.
+
+    ``backend`` is :mod:`radar.store` or :mod:`radar.pg_store`, which provide
+    ``unclustered_events``, ``clustered_events_between`` and ``set_incident_ids``.
+    """
+    new_rows = backend.unclustered_events(conn)
+    if not new_rows:
+        return 0
+    times = [r["event_time"] for r in new_rows if r.get("event_time") is not None]
+    window = timedelta(hours=window_hours)
+    clustered = backend.clustered_events_between(conn, min(times) - window, max(times) + window) if times else []
+    assignments = assign_incidents(new_rows, clustered, radius_km, window_hours)
+    backend.set_incident_ids(conn, assignments)
+    return len(assignments)
@@ -0,0 +1,192 @@
+"""Long-running ingest scheduler with adaptive per-feed polling."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Set
+
+if TYPE_CHECKING:  # pragma: no cover
+    from http.server import ThreadingHTTPServer
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+@dataclass
+class Feed:
+    """A single source polled on its own interval."""
+
+    kind: str
+    url: str
+    interval: float
+    options: Dict[str, Any] = field(default_factory=dict)
+    next_run: float = 0.0
+    last_new: int = 0
+    seen: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class Task:
+    """Housekeeping run on a fixed interval alongside the feeds."""
+
+    interval: float
+    run: Callable[[], None]
+    next_run: float = 0.0
+
+
+def adapt_interval(interval: float, new_count: int, min_interval: float, max_interval: float) -> float:
+    """Halve the interval when a poll found new items, back off by 1.5x when it did not."""
+    interval = interval / 2 if new_count else interval * 1.5
+    return max(min_interval, min(max_interval, interval))
+
+
+class Scheduler:
+    """Polls each feed when due and adapts its interval to how often it changes.
+
+    ``poll`` receives a feed and returns the keys (event uids) of the items the
+    feed currently publishes; keys not seen on the previous poll count as new.
+    A poll that raises or returns nothing keeps the previous keys, so a fetch
+    failure does not make the whole feed look new on the next poll.
+    """
+
+    def __init__(
+        self,
+        feeds: Iterable[Feed],
+        poll: Callable[[Feed], Iterable[str]],
+        min_interval: float = 60,
+        max_interval: float = 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.feeds: List[Feed] = list(feeds)
+        self.poll = poll
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.clock = clock
+        self.tasks: List[Task] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+
+    def every(self, interval: float, run: Callable[[], None]) -> Task:
+        """Call ``run`` every ``interval`` seconds, first after one interval."""
+        task = Task(interval, run, self.clock() + interval)
+        self.tasks.append(task)
+        return task
+
+    def due(self, now: float) -> List[Feed]:
+        with self._lock:
+            return [f for f in self.feeds if f.next_run <= now]
+
+    def run_once(self, now: float | None = None) -> int:
+        """Poll every due feed; returns the number of feeds polled."""
+        now = self.clock() if now is None else now
+        feeds = self.due(now)
+        for feed in feeds:
+            try:
+                keys = set(self.poll(feed))
+            except Exception as exc:  # keep the daemon alive on a bad feed
+                print(f"Poll failed for {feed.url}: {exc}")
+                keys = set()
+            if not keys:
+                keys = set(feed.seen)
+            with self._lock:
+                feed.last_new = len(keys - feed.seen)
+                feed.seen = keys
+                feed.interval = adapt_interval(
+                    feed.interval, feed.last_new, self.min_interval, self.max_interval
+                )
+                feed.next_run = self.clock() + feed.interval
+        for task in self.tasks:
+            if task.next_run <= now:
+                try:
+                    task.run()
+                except Exception as exc:
+                    print(f"Task {getattr(task.run, '__name__', task.run)} failed: {exc}")
+                task.next_run = self.clock() + task.interval
+        return len(feeds)
+
+    def trigger(self) -> None:
+        """Mark every feed due and wake the loop."""
+        with self._lock:
+            for feed in self.feeds:
+                feed.next_run = 0.0
+        self.wake()
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def seconds_until_next(self) -> float:
+        with self._lock:
+            runs = [f.next_run for f in self.feeds] + [t.next_run for t in self.tasks]
+            if not runs:
+                return self.max_interval
+            return max(0.0, min(runs) - self.clock())
+
+    def status(self) -> List[dict]:
+        now = self.clock()
+        with self._lock:
+            return [
+                {
+                    "kind": f.kind,
+                    "url": f.url,
+                    "interval": f.interval,
+                    "next_run_in": max(0.0, f.next_run - now),
+                    "last_new": f.last_new,
+                }
+                for f in self.feeds
+            ]
+
+    def serve_forever(self, stop: threading.Event) -> None:
+        while not stop.is_set():
+            self.run_once()
+            self._wake.wait(self.seconds_until_next())
+            self._wake.clear()
+
+
+def start_trigger_server(
+    scheduler: Scheduler, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+) -> ThreadingHTTPServer:
+    """Serve ``POST /trigger`` and ``GET /status`` on a background thread."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, code: int, body: object) -> None:
+            payload = json.dumps(body).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_POST(self) -> None:  # noqa: N802
+            if self.path != "/trigger":
+                self._reply(404, {"error": "not found"})
+                return
+            scheduler.trigger()
+            self._reply(202, {"triggered": True})
+
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path != "/status":
+                self._reply(404, {"error": "not found"})
+                return
+            self._reply(200, scheduler.status())
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    httpd = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def request_trigger(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, timeout: float = 2) -> bool:
+    """Ask a running daemon to poll all feeds now; False if none is listening."""
+    import urllib.request
+
+    req = urllib.request.Request(f"http://{host}:{port}/trigger", data=b"", method="POST")
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status == 202
+    except Exception:
+        return False
@@ -3,20 +3,27 @@ from __future__ import annotations
 
 from collections import deque
 from datetime import datetime, timedelta, timezone
-from typing import Deque, Tuple
-
-try:  # pragma: no cover - dependency optional
-    from simhash import Simhash  # type: ignore[import-not-found]
-except Exception:  # pragma: no cover
-    class Simhash:  # type: ignore[no-redef]
-        def __init__(self, text: str):
-            self.value = hash(text)
+from typing import Any, Deque, Tuple
 
 _seen: Deque[Tuple[int, datetime]] = deque()
+_Simhash: Any = None
+
+
+class _FallbackSimhash:
+    def __init__(self, text: str):
+        self.value = hash(text)
 
 
 def simhash_of(text: str) -> int:
-    return Simhash(text).value
+    global _Simhash
+    if _Simhash is None:
+        try:  # pragma: no cover - dependency optional
+            from simhash import Simhash  # type: ignore[import-not-found]
+
+            _Simhash = Simhash
+        except Exception:  # pragma: no cover
+            _Simhash = _FallbackSimhash
+    return _Simhash(text).value
 
 
 def is_dupe(simhash: int, window_hours: int = 24) -> bool:
@@ -2,18 +2,21 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 import json
-import pandas as pd  # type: ignore[import-untyped]
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd  # type: ignore[import-untyped]
 
 
 def to_geojson(df: pd.DataFrame, path: str) -> None:
+    import pandas as pd  # type: ignore[import-untyped]
+
     features = []
     for _, row in df.iterrows():
         if pd.isna(row.get("lat")) or pd.isna(row.get("lon")):
             continue
-        props = row.to_dict()
-        if isinstance(props.get("event_time"), pd.Timestamp):
-            props["event_time"] = str(props["event_time"])
+        props = {k: str(v) if isinstance(v, pd.Timestamp) else v for k, v in row.to_dict().items()}
         features.append(
             {
                 "type": "Feature",
@@ -35,6 +38,8 @@ def to_csv(df: pd.DataFrame, path: str) -> None:
 
 
 def to_obsidian_note(row: pd.Series, vault_path: str) -> Path:
+    import pandas as pd  # type: ignore[import-untyped]
+
     date = pd.to_datetime(row["event_time"]).date()
     directory = Path(vault_path) / "News" / "Events" / str(date)
     directory.mkdir(parents=True, exist_ok=True)
@@ -3,32 +3,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List
+from typing import Any, List
 import re
 
-try:  # pragma: no cover - optional deps
-    import dateparser  # type: ignore[import-untyped]
-except Exception:  # pragma: no cover
-    dateparser = None  # type: ignore
-from dateutil import parser as dateutil_parser  # type: ignore[import-untyped]
-try:  # pragma: no cover
-    import spacy  # type: ignore[import-not-found]
-except Exception:  # pragma: no cover
-    class _DummyNLP:
-        def __call__(self, _text: str):
-            class _Doc:
-                ents: list = []
 
-            return _Doc()
+class _DummyNLP:
+    def __call__(self, _text: str):
+        class _Doc:
+            ents: list = []
 
-    class _SpacyModule:
-        def blank(self, _lang: str):  # noqa: D401
-            return _DummyNLP()
+        return _Doc()
 
-    spacy = _SpacyModule()  # type: ignore
 
-
-_nlp: spacy.language.Language | None = None
+_nlp: Any = None
+_dateparser: Any = None
 
 
 @dataclass
@@ -36,26 +24,51 @@ class Candidate:
     text: str
 
 
-def load_spacy() -> spacy.language.Language:
-    """Load spaCy model with graceful fallback."""
+def load_spacy() -> Any:
+    """Load spaCy model with graceful fallback; spaCy is imported on first use."""
     global _nlp
     if _nlp is None:
         try:
-            if spacy is None:
-                raise ImportError
+            import spacy  # type: ignore[import-not-found]
+        except Exception:  # pragma: no cover - optional dep
+            _nlp = _DummyNLP()
+            return _nlp
+        try:
             _nlp = spacy.load("en_core_web_sm")
         except Exception:  # pragma: no cover - model not installed
             _nlp = spacy.blank("en")
     return _nlp
 
 
+def _load_dateparser() -> Any:
+    """Return the dateparser module, or False when it is not installed."""
+    global _dateparser
+    if _dateparser is None:
+        try:  # pragma: no cover - optional deps
+            import dateparser  # type: ignore[import-untyped]
+
+            _dateparser = dateparser
+        except Exception:  # pragma: no cover
+            _dateparser = False
+    return _dateparser
+
+
+LOCATION_LABELS = {"GPE", "LOC"}
+
+
 def extract_candidates(text: str, title: str = "") -> List[Candidate]:
     nlp = load_spacy()
     doc = nlp(f"{title}\n{text}")
     ents = getattr(doc, "ents", [])
     if not ents:  # very simple fallback
         return [Candidate(m) for m in re.findall(r"[A-Z][a-z]+", f"{title} {text}")]
-    return [Candidate(ent.text) for ent in ents if getattr(ent, "label_", "") in {"GPE", "LOC"}]
+    return [Candidate(ent.text) for ent in ents if getattr(ent, "label_", "") in LOCATION_LABELS]
+
+
+def extract_locations(text: str, title: str = "") -> List[Candidate]:
+    """GPE/LOC entities only, without the capitalised-word fallback."""
+    doc = load_spacy()(f"{title}\n{text}")
+    return [Candidate(ent.text) for ent in getattr(doc, "ents", []) if getattr(ent, "label_", "") in LOCATION_LABELS]
 
 
 def _ensure_aware(dt: datetime) -> datetime:
@@ -64,19 +77,23 @@ def _ensure_aware(dt: datetime) -> datetime:
     return dt
 
 
-def extract_event_time(meta: str | datetime | None) -> datetime:
+def extract_event_time(meta: str | datetime | None, default: datetime | None = None) -> datetime:
+    """Event time from a timestamp or free text; ``default`` (else now) when none is found."""
     if isinstance(meta, datetime):
         return _ensure_aware(meta)
     if isinstance(meta, str):
+        dateparser = _load_dateparser()
         dt = dateparser.parse(meta, settings={"RETURN_AS_TIMEZONE_AWARE": True}) if dateparser else None
         if not dt:
+            from dateutil import parser as dateutil_parser  # type: ignore[import-untyped]
+
             try:
                 dt = dateutil_parser.parse(meta, fuzzy=True)
             except Exception:
                 dt = None
         if dt:
             return _ensure_aware(dt)
-    return datetime.now(timezone.utc)
+    return default or datetime.now(timezone.utc)
 
 
 KEYWORDS = [
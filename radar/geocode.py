@@ -7,16 +7,12 @@ import sqlite3
 import time
 from typing import Tuple
 
-try:  # pragma: no cover - optional
-    from geopy.geocoders import Nominatim  # type: ignore[import-not-found]
-except Exception:  # pragma: no cover
-    Nominatim = None  # type: ignore
-
 
 class GeoCoder:
     def __init__(self, cache_sqlite_path: str, user_agent: str = "open-radar"):
         Path(cache_sqlite_path).parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(cache_sqlite_path)
+        # Shard workers share the cache file, so wait on locks instead of failing
+        self.conn = sqlite3.connect(cache_sqlite_path, timeout=30)
         self.conn.execute(
             """
             CREATE TABLE IF NOT EXISTS geocache (
@@ -29,7 +25,9 @@ class GeoCoder:
             """
         )
         self.conn.commit()
-        if Nominatim is None:
+        try:  # pragma: no cover - optional
+            from geopy.geocoders import Nominatim  # type: ignore[import-not-found]
+        except Exception:  # pragma: no cover
             class _Dummy:
                 def geocode(self, _query: str):
                     return None
@@ -38,7 +36,12 @@ class GeoCoder:
         else:
             self.geocoder = Nominatim(user_agent=user_agent)
 
-    def geocode(self, text: str) -> Tuple[float | None, float | None, float | None]:
+    def geocode(self, text: str, strict: bool = False) -> Tuple[float | None, float | None, float | None]:
+        """Cached lookup of ``text``; "no match" is cached, errors are not.
+
+        With ``strict`` a geocoder error (timeout, rate limit) is raised so the
+        caller can retry later; otherwise it yields ``(None, None, None)``.
+        """
         key = text.strip().casefold()
         cur = self.conn.execute("SELECT lat, lon, accuracy FROM geocache WHERE query=?", (key,))
         row = cur.fetchone()
@@ -48,7 +51,9 @@ class GeoCoder:
         try:
             loc = self.geocoder.geocode(key)
         except Exception:
-            loc = None
+            if strict:
+                raise
+            return None, None, None
         if loc:
             lat = loc.latitude
             lon = loc.longitude
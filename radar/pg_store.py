@@ -1,6 +1,7 @@
 """PostGIS storage backend for idempotent event ingestion."""
 from __future__ import annotations
 
+from datetime import datetime
 from typing import List, Dict, Any
 
 try:
@@ -28,11 +29,15 @@ CREATE TABLE IF NOT EXISTS events (
     simhash     NUMERIC(20),
     first_seen  TIMESTAMPTZ DEFAULT now(),
     last_seen   TIMESTAMPTZ DEFAULT now(),
-    geom        GEOMETRY(Point, 4326)
+    geom        GEOMETRY(Point, 4326),
+    incident_id TEXT
 );
 
+ALTER TABLE events ADD COLUMN IF NOT EXISTS incident_id TEXT;
+
 CREATE INDEX IF NOT EXISTS events_geom_idx ON events USING GIST (geom);
 CREATE INDEX IF NOT EXISTS events_time_idx ON events (event_time);
+CREATE INDEX IF NOT EXISTS events_incident_idx ON events (incident_id);
 """
 
 _UPSERT = """
@@ -72,3 +77,39 @@ def upsert_events(conn, rows: List[Dict[str, Any]]) -> int:
         psycopg2.extras.execute_batch(cur, _UPSERT, rows)
     conn.commit()
     return len(rows)
+
+
+_CLUSTER_SELECT = """
+SELECT event_uid, ST_Y(geom) AS lat, ST_X(geom) AS lon, event_time, event_type, incident_id
+FROM events
+"""
+
+
+def _fetch_dicts(conn, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+    with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        cur.execute(sql, params)
+        return [dict(row) for row in cur.fetchall()]
+
+
+def unclustered_events(conn) -> List[Dict[str, Any]]:
+    """Events inserted since the last clustering pass."""
+    return _fetch_dicts(conn, _CLUSTER_SELECT + "WHERE incident_id IS NULL")
+
+
+def clustered_events_between(conn, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+    return _fetch_dicts(
+        conn,
+        _CLUSTER_SELECT
+        + "WHERE incident_id IS NOT NULL AND geom IS NOT NULL AND event_time BETWEEN %s AND %s",
+        (start, end),
+    )
+
+
+def set_incident_ids(conn, assignments: Dict[str, str]) -> None:
+    with conn.cursor() as cur:
+        psycopg2.extras.execute_batch(
+            cur,
+            "UPDATE events SET incident_id = %s WHERE event_uid = %s",
+            [(incident_id, uid) for uid, incident_id in assignments.items()],
+        )
+    conn.commit()
@@ -0,0 +1,158 @@
+"""Hot/cold retention: archive old events to date-partitioned Parquet."""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+import sqlite3
+from typing import TYPE_CHECKING, List, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    import duckdb  # type: ignore[import-not-found]
+    import pandas as pd  # type: ignore[import-untyped]
+
+PARTITION_KEY = "event_date"
+
+
+def _sql_str(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def archive_events(
+    duck: duckdb.DuckDBPyConnection,
+    archive_dir: str,
+    horizon_days: float,
+    sqlite_conn: sqlite3.Connection | None = None,
+    now: datetime | None = None,
+    vacuum_free_ratio: float = 0.25,
+) -> int:
+    """Move events older than ``horizon_days`` into ``archive_dir``; returns rows moved.
+
+    Rows are appended as Parquet under ``event_date=YYYY-MM-DD/`` (UTC) and
+    deleted from the hot table along with their ``articles`` rows. DuckDB is
+    checkpointed; SQLite is vacuumed only once at least ``vacuum_free_ratio``
+    of its pages are free, so frequent small archives do not rewrite it.
+    Archived uids are recorded in ``archived_uids`` so they are neither
+    re-inserted nor archived twice.
+    """
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=horizon_days)
+    cutoff_sql = f"TIMESTAMPTZ {_sql_str(cutoff.isoformat())}"
+    uids = [r[0] for r in duck.execute(f"SELECT event_uid FROM events WHERE event_time < {cutoff_sql}").fetchall()]
+    if not uids:
+        return 0
+    Path(archive_dir).mkdir(parents=True, exist_ok=True)
+    duck.execute("BEGIN TRANSACTION")
+    try:
+        duck.execute(
+            f"""
+            COPY (
+                SELECT *, strftime(timezone('UTC', event_time), '%Y-%m-%d') AS {PARTITION_KEY}
+                FROM events
+                WHERE event_time < {cutoff_sql}
+                  AND event_uid NOT IN (SELECT event_uid FROM archived_uids)
+            ) TO {_sql_str(str(archive_dir))}
+            (FORMAT PARQUET, PARTITION_BY ({PARTITION_KEY}), APPEND, FILENAME_PATTERN 'events_{{uuid}}')
+            """
+        )
+        duck.execute(
+            f"""
+            INSERT INTO archived_uids SELECT event_uid FROM events WHERE event_time < {cutoff_sql}
+            ON CONFLICT DO NOTHING
+            """
+        )
+        duck.execute(f"DELETE FROM events WHERE event_time < {cutoff_sql}")
+        duck.execute("COMMIT")
+    except Exception:
+        duck.execute("ROLLBACK")
+        raise
+    duck.execute("CHECKPOINT")
+    if sqlite_conn is not None:
+        sqlite_conn.executemany("DELETE FROM articles WHERE id = ?", [(uid,) for uid in uids])
+        sqlite_conn.commit()
+        vacuum_if_fragmented(sqlite_conn, vacuum_free_ratio)
+    return len(uids)
+
+
+def vacuum_if_fragmented(sqlite_conn: sqlite3.Connection, min_free_ratio: float) -> bool:
+    """VACUUM when free pages make up at least ``min_free_ratio`` of the file."""
+    (pages,) = sqlite_conn.execute("PRAGMA page_count").fetchone()
+    (free,) = sqlite_conn.execute("PRAGMA freelist_count").fetchone()
+    if not pages or free / pages < min_free_ratio:
+        return False
+    sqlite_conn.execute("VACUUM")
+    return True
+
+
+def partitions(archive_dir: str) -> List[Tuple[date, Path]]:
+    """Return ``(date, directory)`` for every archive partition, oldest first."""
+    root = Path(archive_dir)
+    if not root.is_dir():
+        return []
+    found = []
+    for child in root.iterdir():
+        key, _, value = child.name.partition("=")
+        if child.is_dir() and key == PARTITION_KEY:
+            try:
+                found.append((date.fromisoformat(value), child))
+            except ValueError:
+                continue
+    return sorted(found)
+
+
+def _range_filter(start: datetime | None, end: datetime | None) -> Tuple[str, List[datetime]]:
+    clauses, params = [], []
+    if start is not None:
+        clauses.append("event_time >= ?")
+        params.append(start)
+    if end is not None:
+        clauses.append("event_time <= ?")
+        params.append(end)
+    return (f" WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+
+def _archive_scan(archive_dir: str | None, start: datetime | None, end: datetime | None) -> str | None:
+    """``read_parquet`` over the partitions overlapping ``[start, end]``, or None if there are none."""
+    lo = start.astimezone(timezone.utc).date() if start else None
+    hi = end.astimezone(timezone.utc).date() if end else None
+    files = [
+        str(path / "*.parquet")
+        for day, path in partitions(archive_dir or "")
+        if (lo is None or day >= lo) and (hi is None or day <= hi)
+    ]
+    if not files:
+        return None
+    # union_by_name: partitions written before a column was added have an older schema
+    return f"read_parquet([{', '.join(_sql_str(f) for f in files)}], hive_partitioning = false, union_by_name = true)"
+
+
+def archived_events(
+    duck: duckdb.DuckDBPyConnection,
+    archive_dir: str | None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> pd.DataFrame:
+    """Archived events in ``[start, end]``, reading only the partitions in range."""
+    where, params = _range_filter(start, end)
+    scan = _archive_scan(archive_dir, start, end)
+    if scan is None:
+        return duck.execute("SELECT * FROM events WHERE false").fetchdf()
+    return duck.execute(f"SELECT * FROM {scan}{where}", params).fetchdf()
+
+
+def query_events(
+    duck: duckdb.DuckDBPyConnection,
+    archive_dir: str | None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> pd.DataFrame:
+    """Events from the hot table plus any archive partitions overlapping ``[start, end]``.
+
+    Partitions are pruned by their directory date, so a range inside the hot
+    horizon never opens a Parquet file.
+    """
+    where, params = _range_filter(start, end)
+    sql = f"SELECT * FROM events{where}"
+    scan = _archive_scan(archive_dir, start, end)
+    if scan is not None:
+        sql += f" UNION ALL BY NAME SELECT * FROM {scan}{where}"
+        params = params * 2
+    return duck.execute(sql, params).fetchdf()
@@ -0,0 +1,149 @@
+"""Sharded ingestion: partition sources, stage per-shard results, merge deterministically."""
+from __future__ import annotations
+
+from datetime import timedelta
+import hashlib
+import os
+from pathlib import Path
+import re
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+STAGING_COLUMNS: List[Tuple[str, str]] = [
+    ("event_uid", "TEXT"),
+    ("source", "TEXT"),
+    ("title", "TEXT"),
+    ("link", "TEXT"),
+    ("summary", "TEXT"),
+    ("event_time", "TIMESTAMPTZ"),
+    ("lat", "DOUBLE"),
+    ("lon", "DOUBLE"),
+    ("event_type", "TEXT"),
+    ("city", "TEXT"),
+    ("state", "TEXT"),
+    ("country", "TEXT"),
+    ("confidence", "DOUBLE"),
+    # simhash is stored as text: 64-bit unsigned values do not survive Parquet HUGEINT
+    ("simhash", "TEXT"),
+]
+
+_STAGING_RE = re.compile(r"shard-(\d+)-of-(\d+)\.parquet$")
+
+
+def shard_of(key: str, count: int) -> int:
+    """Stable shard number for ``key`` (independent of process and hash seed)."""
+    return int(hashlib.sha1(key.encode()).hexdigest(), 16) % count
+
+
+def select_shard(specs: Iterable[T], index: int, count: int) -> List[T]:
+    """Feed specs ``(kind, url, options)`` owned by shard ``index`` of ``count``."""
+    return [spec for spec in specs if shard_of(spec[1], count) == index]  # type: ignore[index]
+
+
+def staging_path(staging_dir: str, index: int, count: int) -> Path:
+    return Path(staging_dir) / f"shard-{index:04d}-of-{count:04d}.parquet"
+
+
+def write_staging(events: Sequence[Dict[str, Any]], path: Path) -> Path:
+    """Write one shard's events to Parquet; the file appears atomically."""
+    import duckdb  # type: ignore[import-not-found]
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".parquet.tmp")
+    conn = duckdb.connect()
+    try:
+        conn.execute(f"CREATE TABLE staged ({', '.join(f'{n} {t}' for n, t in STAGING_COLUMNS)})")
+        if events:
+            conn.executemany(
+                f"INSERT INTO staged VALUES ({', '.join('?' for _ in STAGING_COLUMNS)})",
+                [
+                    [str(ev["simhash"]) if n == "simhash" and ev.get(n) is not None else ev.get(n) for n, _ in STAGING_COLUMNS]
+                    for ev in events
+                ],
+            )
+        escaped = str(tmp).replace("'", "''")
+        conn.execute(f"COPY staged TO '{escaped}' (FORMAT PARQUET)")
+    finally:
+        conn.close()
+    os.replace(tmp, path)
+    return path
+
+
+def clear_staging(staging_dir: str) -> None:
+    """Remove staging files left behind by an earlier run."""
+    for path in Path(staging_dir).glob("shard-*.parquet*"):
+        path.unlink()
+
+
+def staged_files(staging_dir: str) -> List[Path]:
+    """All staging files, after checking every shard of a single run is present."""
+    found: Dict[int, Path] = {}
+    counts = set()
+    for path in Path(staging_dir).glob("shard-*-of-*.parquet"):
+        m = _STAGING_RE.search(path.name)
+        if m:
+            found[int(m.group(1))] = path
+            counts.add(int(m.group(2)))
+    if not found:
+        return []
+    if len(counts) != 1:
+        raise RuntimeError(f"Staging dir {staging_dir} mixes shard counts {sorted(counts)}")
+    missing = set(range(counts.pop())) - found.keys()
+    if missing:
+        raise RuntimeError(f"Staging dir {staging_dir} is missing shards {sorted(missing)}")
+    return [found[i] for i in sorted(found)]
+
+
+def read_staging(files: Sequence[Path]) -> List[Dict[str, Any]]:
+    import duckdb  # type: ignore[import-not-found]
+
+    if not files:
+        return []
+    conn = duckdb.connect()
+    try:
+        paths = ", ".join("'" + str(f).replace("'", "''") + "'" for f in files)
+        cur = conn.execute(f"SELECT * FROM read_parquet([{paths}])")
+        names = [d[0] for d in cur.description]
+        rows = [dict(zip(names, row)) for row in cur.fetchall()]
+    finally:
+        conn.close()
+    for row in rows:
+        if row.get("simhash") is not None:
+            row["simhash"] = int(row["simhash"])
+    return rows
+
+
+def merge_events(rows: Iterable[Dict[str, Any]], window_hours: float = 24) -> List[Dict[str, Any]]:
+    """Cross-shard dedupe by ``event_uid`` then by simhash within ``window_hours``.
+
+    Rows are visited in a total order that does not depend on which shard
+    produced them, so the result is the same for any number of workers.
+    """
+    window = timedelta(hours=window_hours)
+    ordered = sorted(
+        rows,
+        key=lambda r: (
+            r.get("event_time") is None,
+            r.get("event_time") or 0,
+            r["event_uid"],
+            r.get("source") or "",
+            r.get("link") or "",
+        ),
+    )
+    merged: List[Dict[str, Any]] = []
+    seen_uids = set()
+    last_by_hash: Dict[int, Any] = {}
+    for row in ordered:
+        if row["event_uid"] in seen_uids:
+            continue
+        h, t = row.get("simhash"), row.get("event_time")
+        if h is not None and h in last_by_hash:
+            prev = last_by_hash[h]
+            if t is None or prev is None or t - prev <= window:
+                continue
+        seen_uids.add(row["event_uid"])
+        if h is not None:
+            last_by_hash[h] = t
+        merged.append(row)
+    return merged
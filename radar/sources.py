@@ -2,29 +2,50 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List
+from datetime import datetime, timezone
+import re
+from typing import Any, Dict, IO, Iterator, List
+from urllib.parse import urljoin
 
-import feedparser  # type: ignore[import-untyped]
-import requests  # type: ignore[import-untyped]
+DEFAULT_JSON_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "summary": "summary",
+    "time": "published",
+    "lat": "lat",
+    "lon": "lon",
+}
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
-    """Normalized feed item."""
+    """Normalized feed item; ``lat``/``lon`` are set when the source is pre-geocoded."""
 
     source: str
     title: str
     link: str
     summary: str
     published: datetime | None
+    lat: float | None = None
+    lon: float | None = None
 
 
-def fetch_rss(urls: List[str]) -> List[Item]:
-    """Fetch RSS/Atom feeds and return normalized items."""
+def fetch_rss(urls: List[str], strict: bool = False) -> List[Item]:
+    """Fetch RSS/Atom feeds and return normalized items.
+
+    With ``strict`` a feed that could not be fetched or parsed at all raises
+    instead of looking like an empty feed.
+    """
+    import feedparser  # type: ignore[import-untyped]
+
     items: List[Item] = []
     for url in urls:
         feed = feedparser.parse(url)
+        if strict and not feed.entries:
+            if feed.get("status", 200) >= 400:
+                raise OSError(f"HTTP {feed.status} fetching {url}")
+            if feed.bozo:
+                raise feed.bozo_exception
         for entry in feed.entries:
             published = None
             dt = entry.get("published") or entry.get("updated")
@@ -48,45 +69,201 @@ def fetch_rss(urls: List[str]) -> List[Item]:
     return items
 
 
-def fetch_json(url: str) -> List[Item]:
-    """Fetch JSON feed with list of items."""
-    items: List[Item] = []
+def _lookup(obj: Any, path: str | None) -> Any:
+    """Resolve a dotted path such as ``geometry.coordinates.1`` inside a record."""
+    if not path:
+        return None
+    for part in path.split("."):
+        if isinstance(obj, dict):
+            obj = obj.get(part)
+        elif isinstance(obj, list) and part.lstrip("-").isdigit() and -len(obj) <= int(part) < len(obj):
+            obj = obj[int(part)]
+        else:
+            return None
+    return obj
+
+
+def _parse_time(value: Any) -> datetime | None:
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        seconds = value / 1000 if value > 1e11 else value  # epoch millis vs seconds
+        return datetime.fromtimestamp(seconds, tz=timezone.utc)
+    text = str(value)
     try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
+        return datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    from dateutil import parser as dateutil_parser  # type: ignore[import-untyped]
+
+    try:
+        return dateutil_parser.parse(text)
     except Exception:
-        return items
-    for obj in data if isinstance(data, list) else data.get("items", []):
-        items.append(
-            Item(
-                source=url,
-                title=obj.get("title", ""),
-                link=obj.get("link", ""),
-                summary=obj.get("summary", ""),
-                published=None,
-            )
-        )
-    return items
+        return None
+
+
+def _as_float(value: Any) -> float | None:
+    try:
+        return float(value) if value is not None and value != "" else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _iter_records(stream: IO[bytes], items_path: str | None, next_key: str | None, meta: Dict[str, Any]) -> Iterator[Any]:
+    """Yield records from a JSON body one at a time.
+
+    Without ``items_path`` a top-level array (``item``) or an ``items`` array
+    (``items.item``) is used. A string found at ``next_key`` is stored in
+    ``meta["next"]``. Falls back to loading the whole body when ijson is missing.
+    """
+    try:
+        import ijson  # type: ignore[import-not-found]
+    except ImportError:  # pragma: no cover - optional dep
+        import json
+
+        data = json.load(stream)
+        if items_path:
+            path = items_path[: -len("item")].rstrip(".") if items_path.endswith("item") else items_path
+            records = (_lookup(data, path) if path else data) or []
+        else:
+            records = data if isinstance(data, list) else data.get("items", [])
+        if next_key and isinstance(data, dict) and isinstance(_lookup(data, next_key), str):
+            meta["next"] = _lookup(data, next_key)
+        yield from records
+        return
 
+    events = ijson.parse(stream, use_float=True)
+    for prefix, event, value in events:
+        if items_path is None and prefix == "":
+            items_path = "item" if event == "start_array" else "items.item"
+        if prefix == next_key and event == "string":
+            meta["next"] = value
+        if prefix != items_path or event in ("end_map", "end_array"):
+            continue
+        if event not in ("start_map", "start_array"):
+            yield value
+            continue
+        builder = ijson.ObjectBuilder()
+        end_event = event.replace("start", "end")
+        while prefix != items_path or event != end_event:
+            builder.event(event, value)
+            prefix, event, value = next(events)
+        yield builder.value
 
-def fetch_article_html(url: str) -> str:
-    """Fetch article HTML, trying trafilatura then newspaper3k."""
+
+def iter_json(
+    url: str,
+    items_path: str | None = None,
+    fields: Dict[str, str] | None = None,
+    next_key: str | None = "next",
+    offset_param: str | None = None,
+    limit_param: str = "limit",
+    page_size: int = 100,
+    max_pages: int = 1000,
+    timeout: float = 10,
+    strict: bool = False,
+) -> Iterator[Item]:
+    """Stream items from a (possibly paginated) JSON endpoint.
+
+    Pages are followed through a ``next`` URL in the body or ``Link`` header,
+    or, when ``offset_param`` is set, by advancing the offset until a short
+    page. ``fields`` maps item attributes to dotted paths in each record.
+    A page that fails (HTTP error, dropped connection) ends the feed with a
+    message; with ``strict`` the error is raised so callers can tell a
+    truncated feed from a complete one.
+    """
+    import requests  # type: ignore[import-untyped]
+
+    mapping = DEFAULT_JSON_FIELDS | (fields or {})
+    page_url: str | None = url
+    offset = 0
+    for page in range(1, max_pages + 1):
+        if page_url is None:
+            return
+        params = {offset_param: offset, limit_param: page_size} if offset_param else None
+        meta: Dict[str, Any] = {}
+        count = 0
+        try:
+            with requests.get(page_url, params=params, timeout=timeout, stream=True) as resp:
+                resp.raise_for_status()
+                resp.raw.decode_content = True
+                for obj in _iter_records(resp.raw, items_path, next_key, meta):
+                    count += 1
+                    if not isinstance(obj, dict):
+                        continue
+                    yield Item(
+                        source=url,
+                        title=str(_lookup(obj, mapping["title"]) or ""),
+                        link=str(_lookup(obj, mapping["link"]) or ""),
+                        summary=str(_lookup(obj, mapping["summary"]) or ""),
+                        published=_parse_time(_lookup(obj, mapping["time"])),
+                        lat=_as_float(_lookup(obj, mapping["lat"])),
+                        lon=_as_float(_lookup(obj, mapping["lon"])),
+                    )
+                link_next = resp.links.get("next", {}).get("url")
+        except Exception as exc:
+            print(f"Abandoned {url} at page {page} after {count} records: {exc!r}")
+            if strict:
+                raise
+            return
+        if offset_param:
+            offset += count
+            page_url = page_url if count >= page_size else None
+        else:
+            next_url = meta.get("next") or link_next
+            page_url = urljoin(page_url, next_url) if next_url else None
+
+
+def fetch_json(url: str, **options: Any) -> List[Item]:
+    """Fetch JSON feed with list of items."""
+    return list(iter_json(url, **options))
+
+
+_TRANSIENT_ERROR = re.compile(r"\b(?:429|5\d\d) (?:Client|Server) Error|timed out|Connection", re.IGNORECASE)
+
+
+def _transient_status(status: int | None) -> bool:
+    """No response at all, rate limiting or a server error: worth retrying later."""
+    return status is None or status == 429 or status >= 500
+
+
+def fetch_article_html(url: str, strict: bool = False) -> str:
+    """Fetch article HTML, trying trafilatura then newspaper3k.
+
+    Failures yield ``""``. With ``strict``, transient failures (no response,
+    timeouts, 429 and 5xx) are raised so the caller can retry; permanent ones
+    such as 404/403 or a paywall still yield ``""``.
+    """
+    transient: Exception | None = None
     try:  # pragma: no cover - network heavy
         import trafilatura  # type: ignore[import-not-found]
-
-        downloaded = trafilatura.fetch_url(url)
-        text = trafilatura.extract(downloaded or "")
-        if text:
-            return text
-    except Exception:
+    except ImportError:
         pass
+    else:
+        try:  # pragma: no cover - network heavy
+            resp = trafilatura.fetch_response(url, decode=True)
+            status = resp.status if resp is not None else None
+            if _transient_status(status):
+                transient = OSError(f"download failed ({status or 'no response'}): {url}")
+            elif status == 200:
+                text = trafilatura.extract(resp.html or "")
+                if text:
+                    return text
+        except Exception:
+            pass
     try:  # pragma: no cover - slow
         from newspaper import Article  # type: ignore[import-not-found]
-
-        art = Article(url)
-        art.download()
-        art.parse()
-        return art.text
-    except Exception:
-        return ""
+    except ImportError:
+        pass
+    else:
+        try:  # pragma: no cover - slow
+            art = Article(url)
+            art.download()
+            art.parse()
+            return art.text
+        except Exception as exc:
+            if _TRANSIENT_ERROR.search(str(exc)):
+                transient = exc
+    if strict and transient is not None:
+        raise transient
+    return ""
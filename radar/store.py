@@ -1,12 +1,13 @@
 """Storage helpers for DuckDB and SQLite FTS."""
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
+from typing import TYPE_CHECKING, Any, List, Dict
 import sqlite3
 
-import duckdb  # type: ignore[import-not-found]
-import pandas as pd  # type: ignore[import-untyped]
+if TYPE_CHECKING:  # pragma: no cover
+    import duckdb  # type: ignore[import-not-found]
 
 EVENT_COLUMNS = [
     "event_uid",
@@ -26,6 +27,8 @@ EVENT_COLUMNS = [
 
 
 def connect_duckdb(path: str) -> duckdb.DuckDBPyConnection:
+    import duckdb  # type: ignore[import-not-found]
+
     Path(path).parent.mkdir(parents=True, exist_ok=True)
     conn = duckdb.connect(path)
     conn.execute(
@@ -45,20 +48,32 @@ def connect_duckdb(path: str) -> duckdb.DuckDBPyConnection:
             country     TEXT,
             simhash     HUGEINT,
             first_seen  TIMESTAMPTZ DEFAULT now(),
-            last_seen   TIMESTAMPTZ DEFAULT now()
+            last_seen   TIMESTAMPTZ DEFAULT now(),
+            incident_id TEXT
         )
         """
     )
+    conn.execute("ALTER TABLE events ADD COLUMN IF NOT EXISTS incident_id TEXT")
+    # uids moved to Parquet by radar.retention; never re-inserted into the hot table
+    conn.execute("CREATE TABLE IF NOT EXISTS archived_uids (event_uid TEXT PRIMARY KEY)")
     return conn
 
 
 def insert_events(conn: duckdb.DuckDBPyConnection, rows: List[Dict]) -> List[str]:
-    """Upsert events by event_uid; returns list of uids."""
+    """Upsert events by event_uid; returns the uids written (archived ones are skipped)."""
     if not rows:
         return []
+    archived = {
+        r[0]
+        for r in conn.execute(
+            "SELECT event_uid FROM archived_uids WHERE event_uid = ANY(?)", [[row["event_uid"] for row in rows]]
+        ).fetchall()
+    }
     uids = []
     for row in rows:
         uid = row["event_uid"]
+        if uid in archived:
+            continue
         conn.execute(
             """
             INSERT INTO events (event_uid, source, title, link, summary, event_time,
@@ -89,6 +104,41 @@ def insert_events(conn: duckdb.DuckDBPyConnection, rows: List[Dict]) -> List[str
     return uids
 
 
+_CLUSTER_COLUMNS = "event_uid, lat, lon, event_time, event_type, incident_id"
+
+
+def _cluster_rows(cur: Any) -> List[Dict[str, Any]]:
+    names = [d[0] for d in cur.description]
+    return [dict(zip(names, row)) for row in cur.fetchall()]
+
+
+def unclustered_events(conn: duckdb.DuckDBPyConnection) -> List[Dict[str, Any]]:
+    """Events inserted since the last clustering pass."""
+    return _cluster_rows(conn.execute(f"SELECT {_CLUSTER_COLUMNS} FROM events WHERE incident_id IS NULL"))
+
+
+def clustered_events_between(
+    conn: duckdb.DuckDBPyConnection, start: datetime, end: datetime
+) -> List[Dict[str, Any]]:
+    return _cluster_rows(
+        conn.execute(
+            f"""
+            SELECT {_CLUSTER_COLUMNS} FROM events
+            WHERE incident_id IS NOT NULL AND lat IS NOT NULL AND lon IS NOT NULL
+              AND event_time BETWEEN ? AND ?
+            """,
+            [start, end],
+        )
+    )
+
+
+def set_incident_ids(conn: duckdb.DuckDBPyConnection, assignments: Dict[str, str]) -> None:
+    conn.executemany(
+        "UPDATE events SET incident_id = ? WHERE event_uid = ?",
+        [[incident_id, uid] for uid, incident_id in assignments.items()],
+    )
+
+
 def connect_sqlite(path: str) -> sqlite3.Connection:
     Path(path).parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(path)
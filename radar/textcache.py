@@ -0,0 +1,139 @@
+"""Content-addressed on-disk cache of extracted article text."""
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+import sqlite3
+import time
+from typing import Callable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "cmpid"}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of ``url`` so the same article from different feeds shares a key."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+class TextCache:
+    """Maps normalized URLs to content hashes; text is stored once per hash.
+
+    Blobs live under ``cache_dir/blobs`` and the index in ``cache_dir/index.sqlite``,
+    so the cache is shared across runs and processes. Least recently used blobs
+    are evicted once the total exceeds ``max_bytes``. The total is tracked in
+    memory and only re-summed from the index when eviction is due.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 200 * 1024 * 1024):
+        self.root = Path(cache_dir)
+        (self.root / "blobs").mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.conn = sqlite3.connect(self.root / "index.sqlite", timeout=30)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS urls (
+                url_key      TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS blobs (
+                content_hash TEXT PRIMARY KEY,
+                size         INTEGER NOT NULL,
+                last_access  REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS urls_hash ON urls (content_hash);
+            CREATE INDEX IF NOT EXISTS blobs_lru ON blobs (last_access);
+            """
+        )
+        self.conn.commit()
+        self._total = self.total_bytes()
+
+    def _blob_path(self, content_hash: str) -> Path:
+        return self.root / "blobs" / content_hash[:2] / f"{content_hash}.txt"
+
+    def get(self, url: str) -> str | None:
+        row = self.conn.execute(
+            "SELECT content_hash FROM urls WHERE url_key = ?", (normalize_url(url),)
+        ).fetchone()
+        if not row:
+            return None
+        try:
+            text = self._blob_path(row[0]).read_text(encoding="utf-8")
+        except OSError:  # evicted by another process
+            return None
+        self.conn.execute("UPDATE blobs SET last_access = ? WHERE content_hash = ?", (time.time(), row[0]))
+        self.conn.commit()
+        return text
+
+    def put(self, url: str, text: str) -> str:
+        data = text.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(content_hash)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        now = time.time()
+        added = self.conn.execute(
+            "INSERT OR IGNORE INTO blobs(content_hash, size, last_access) VALUES(?,?,?)",
+            (content_hash, len(data), now),
+        ).rowcount
+        if not added:
+            self.conn.execute("UPDATE blobs SET last_access = ? WHERE content_hash = ?", (now, content_hash))
+        self.conn.execute(
+            "INSERT OR REPLACE INTO urls(url_key, content_hash) VALUES(?,?)",
+            (normalize_url(url), content_hash),
+        )
+        self.conn.commit()
+        if added:
+            self._total += len(data)
+            if self._total > self.max_bytes:
+                self._evict()
+        return content_hash
+
+    def get_or_fetch(self, url: str, fetch: Callable[[str], str]) -> str:
+        """Cached text for ``url``, fetching and storing it on a miss; failures are not cached."""
+        text = self.get(url)
+        if text is None:
+            text = fetch(url)
+            if text:
+                self.put(url, text)
+        return text
+
+    def total_bytes(self) -> int:
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def _evict(self) -> None:
+        self._total = self.total_bytes()  # other processes may have added or evicted blobs
+        excess = self._total - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for content_hash, size in self.conn.execute("SELECT content_hash, size FROM blobs ORDER BY last_access"):
+            if excess <= 0:
+                break
+            victims.append(content_hash)
+            excess -= size
+            self._total -= size
+        for content_hash in victims:
+            self._blob_path(content_hash).unlink(missing_ok=True)
+            self.conn.execute("DELETE FROM blobs WHERE content_hash = ?", (content_hash,))
+            self.conn.execute("DELETE FROM urls WHERE content_hash = ?", (content_hash,))
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
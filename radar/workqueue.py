@@ -0,0 +1,189 @@
+"""Persistent SQLite work queue so interrupted runs resume per item and stage."""
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import datetime
+import json
+from pathlib import Path
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from radar.sources import Item
+
+
+def _encode(value: Any) -> str:
+    def default(obj: Any) -> Any:
+        if isinstance(obj, datetime):
+            return {"__datetime__": obj.isoformat()}
+        raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+    return json.dumps(value, default=default)
+
+
+def _decode(text: str | None) -> Any:
+    if text is None:
+        return None
+
+    def hook(obj: Dict[str, Any]) -> Any:
+        if set(obj) == {"__datetime__"}:
+            return datetime.fromisoformat(obj["__datetime__"])
+        return obj
+
+    return json.loads(text, object_hook=hook)
+
+
+class WorkQueue:
+    """Records each item, the last stage it completed and its intermediate result.
+
+    Items are ``pending`` until written or found to be duplicates (``done``).
+    Items outside a run's ``--since`` window are ``held``: still offered to
+    later runs, but pruned like finished items. A failing item is retried
+    with exponential backoff and ``parked`` after ``max_attempts`` so it no
+    longer blocks the batch. Every transition is committed immediately.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 5, backoff_seconds: float = 60):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS work_items (
+                uid          TEXT PRIMARY KEY,
+                item         TEXT NOT NULL,
+                stage        TEXT NOT NULL DEFAULT 'queued',
+                result       TEXT,
+                status       TEXT NOT NULL DEFAULT 'pending',
+                attempts     INTEGER NOT NULL DEFAULT 0,
+                next_attempt REAL NOT NULL DEFAULT 0,
+                error        TEXT,
+                updated      REAL,
+                simhash      TEXT,
+                claimed      REAL
+            )
+            """
+        )
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(work_items)")}
+        for column, kind in (("simhash", "TEXT"), ("claimed", "REAL")):
+            if column not in columns:
+                self.conn.execute(f"ALTER TABLE work_items ADD COLUMN {column} {kind}")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS work_items_due ON work_items (status, next_attempt)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS work_items_simhash ON work_items (simhash)")
+        self.conn.commit()
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+
+    def enqueue(self, items: Iterable[Tuple[str, Item]], batch_size: int = 500) -> int:
+        """Add items not seen before; returns how many were new."""
+        added = 0
+        now = time.time()
+        for n, (uid, item) in enumerate(items, 1):
+            cur = self.conn.execute(
+                "INSERT OR IGNORE INTO work_items(uid, item, updated) VALUES(?,?,?)",
+                (uid, _encode(asdict(item)), now),
+            )
+            added += cur.rowcount
+            if n % batch_size == 0:
+                self.conn.commit()
+        self.conn.commit()
+        return added
+
+    def due(self, now: float | None = None) -> Iterator[Tuple[str, Item, str, Any]]:
+        """Yield ``(uid, item, stage, result)`` for pending or held items whose backoff expired."""
+        now = time.time() if now is None else now
+        uids = [
+            r[0]
+            for r in self.conn.execute(
+                "SELECT uid FROM work_items WHERE status IN ('pending', 'held') AND next_attempt <= ? ORDER BY rowid",
+                (now,),
+            )
+        ]
+        for uid in uids:
+            row = self.conn.execute("SELECT item, stage, result FROM work_items WHERE uid = ?", (uid,)).fetchone()
+            yield uid, Item(**_decode(row[0])), row[1], _decode(row[2])
+
+    def advance(self, uid: str, stage: str, result: Any = None) -> None:
+        self.conn.execute(
+            "UPDATE work_items SET stage = ?, result = ?, status = 'pending', error = NULL, updated = ? WHERE uid = ?",
+            (stage, _encode(result), time.time(), uid),
+        )
+        self.conn.commit()
+
+    def claim(self, uid: str, simhash: int, window_hours: float = 24, now: float | None = None) -> str | None:
+        """Claim ``simhash`` for ``uid``; returns the uid of an earlier claimant within the window.
+
+        Claims survive restarts, so duplicates are caught across runs. Parked
+        items give up their claim.
+        """
+        now = time.time() if now is None else now
+        row = self.conn.execute(
+            """
+            SELECT uid FROM work_items
+            WHERE simhash = ? AND uid != ? AND status != 'parked' AND claimed >= ?
+            ORDER BY claimed LIMIT 1
+            """,
+            (str(simhash), uid, now - window_hours * 3600),
+        ).fetchone()
+        if row:
+            return row[0]
+        self.conn.execute(
+            "UPDATE work_items SET simhash = ?, claimed = COALESCE(claimed, ?) WHERE uid = ?",
+            (str(simhash), now, uid),
+        )
+        self.conn.commit()
+        return None
+
+    def hold(self, uid: str) -> None:
+        """Set an item aside; it ages from the first time it was held."""
+        self.conn.execute(
+            "UPDATE work_items SET status = 'held', updated = CASE WHEN status = 'held' THEN updated ELSE ? END "
+            "WHERE uid = ?",
+            (time.time(), uid),
+        )
+        self.conn.commit()
+
+    def skip(self, uid: str, reason: str) -> None:
+        self.conn.execute(
+            "UPDATE work_items SET stage = 'skipped', status = 'done', error = ?, updated = ? WHERE uid = ?",
+            (reason, time.time(), uid),
+        )
+        self.conn.commit()
+
+    def fail(self, uid: str, error: str, now: float | None = None) -> str:
+        """Record a failure; returns the new status (``pending`` or ``parked``)."""
+        now = time.time() if now is None else now
+        (attempts,) = self.conn.execute("SELECT attempts FROM work_items WHERE uid = ?", (uid,)).fetchone()
+        attempts += 1
+        status = "parked" if attempts >= self.max_attempts else "pending"
+        self.conn.execute(
+            "UPDATE work_items SET attempts = ?, status = ?, next_attempt = ?, error = ?, updated = ? WHERE uid = ?",
+            (attempts, status, now + self.backoff_seconds * 2 ** (attempts - 1), error, now, uid),
+        )
+        self.conn.commit()
+        return status
+
+    def finish(self, uids: Iterable[str]) -> None:
+        now = time.time()
+        self.conn.executemany(
+            "UPDATE work_items SET stage = 'written', status = 'done', result = NULL, updated = ? WHERE uid = ?",
+            [(now, uid) for uid in uids],
+        )
+        self.conn.commit()
+
+    def counts(self) -> Dict[str, int]:
+        return dict(self.conn.execute("SELECT status, COUNT(*) FROM work_items GROUP BY status").fetchall())
+
+    def parked(self) -> List[Tuple[str, str]]:
+        return self.conn.execute("SELECT uid, error FROM work_items WHERE status = 'parked'").fetchall()
+
+    def prune(self, keep_days: float) -> int:
+        """Forget finished and held items older than ``keep_days`` so the queue stays bounded."""
+        cur = self.conn.execute(
+            "DELETE FROM work_items WHERE status IN ('done', 'held') AND updated < ?",
+            (time.time() - keep_days * 86400,),
+        )
+        self.conn.commit()
+        return cur.rowcount
+
+    def close(self) -> None:
+        self.conn.close()
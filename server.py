@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import subprocess
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import duckdb  # type: ignore[import-not-found]
@@ -11,7 +11,7 @@ import streamlit as st  # type: ignore[import-not-found]
 import yaml  # type: ignore[import-untyped]
 import pydeck as pdk  # type: ignore[import-not-found]
 
-from radar import export, store
+from radar import daemon, export, retention, store
 
 
 def load_config(path: str) -> dict:
@@ -19,15 +19,29 @@ def load_config(path: str) -> dict:
         return yaml.safe_load(f)
 
 
-def load_events(duck_path: str) -> pd.DataFrame:
-    return duckdb.connect(duck_path).execute("SELECT * FROM events").fetchdf()
+def load_events(duck_path: str, archive_dir: str | None = None, since: datetime | None = None) -> pd.DataFrame:
+    """All hot events, plus archived events from ``since`` onwards when ``archive_dir`` is given."""
+    conn = duckdb.connect(duck_path)
+    df = conn.execute("SELECT * FROM events").fetchdf()
+    if archive_dir is None:
+        return df
+    archived = retention.archived_events(conn, archive_dir, start=since)
+    return df if archived.empty else pd.concat([df, archived], ignore_index=True)
 
 
 def main() -> None:
     st.set_page_config(layout="wide")
     cfg_path = st.sidebar.text_input("Config path", "config.yaml")
     cfg = load_config(cfg_path)
-    df = load_events(cfg["duckdb_path"])
+    retention_cfg = cfg.get("retention") or {}
+    archive_dir = retention_cfg.get("archive_dir")
+    since = None
+    if archive_dir and st.sidebar.checkbox("Include archived events"):
+        # the date bounds the archive only; hot events are always loaded
+        horizon = datetime.now(timezone.utc) - timedelta(days=retention_cfg.get("horizon_days", 90))
+        archive_from = st.sidebar.date_input("Archived events from", (horizon - timedelta(days=30)).date())
+        since = datetime.combine(archive_from, datetime.min.time(), tzinfo=timezone.utc)
+    df = load_events(cfg["duckdb_path"], archive_dir if since else None, since)
 
     # Filters
     min_date, max_date = df["event_time"].min(), df["event_time"].max()
@@ -80,7 +94,9 @@ def main() -> None:
 
     st.sidebar.write("Last run:", datetime.fromtimestamp(Path(cfg["duckdb_path"]).stat().st_mtime))
     if st.sidebar.button("Run update now"):
-        subprocess.run(["python", "ingest.py", "--config", cfg_path, "--update"], check=False)
+        opts = cfg.get("daemon") or {}
+        if not daemon.request_trigger(opts.get("host", daemon.DEFAULT_HOST), int(opts.get("port", daemon.DEFAULT_PORT))):
+            subprocess.run(["python", "ingest.py", "--config", cfg_path, "--update"], check=False)
         st.rerun()
 
 
@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta, timezone
+
+from radar import cluster, store
+
+T0 = datetime(2024, 6, 1, 12, tzinfo=timezone.utc)
+
+
+def _ev(uid, lat, lon, minutes=0, event_type="fire", incident_id=None):
+    return {
+        "event_uid": uid,
+        "lat": lat,
+        "lon": lon,
+        "event_time": T0 + timedelta(minutes=minutes),
+        "event_type": event_type,
+        "incident_id": incident_id,
+    }
+
+
+def test_assign_incidents_groups_by_space_time_and_type():
+    rows = [
+        _ev("a", 51.5000, -0.1200),
+        _ev("b", 51.5050, -0.1250, minutes=30),  # ~0.7 km away
+        _ev("c", 51.5000, -0.1200, minutes=60 * 24),  # same place, next day
+        _ev("d", 51.5000, -0.1200, minutes=10, event_type="shooting"),
+        _ev("e", 51.7000, -0.1200, minutes=5),  # ~22 km away
+        _ev("f", None, None),
+    ]
+    got = cluster.assign_incidents(rows, [], radius_km=2, window_hours=6)
+    assert got["a"] == got["b"] == "a"
+    assert got["c"] == "c" and got["d"] == "d" and got["e"] == "e" and got["f"] == "f"
+
+
+def test_grid_reaches_across_longitude_cells_at_high_latitude():
+    rows = [_ev("a", 70.0, 10.0), _ev("b", 70.0, 10.04, minutes=1)]  # ~1.5 km apart
+    got = cluster.assign_incidents(rows, [], radius_km=2, window_hours=1)
+    assert got["b"] == "a"
+
+
+def test_cluster_new_events_is_incremental(tmp_path):
+    conn = store.connect_duckdb(str(tmp_path / "events.db"))
+    store.insert_events(conn, [_ev("a", 40.0, -74.0)])
+    assert cluster.cluster_new_events(conn, store) == 1
+    store.insert_events(conn, [_ev("b", 40.001, -74.001, minutes=20)])
+    assert cluster.cluster_new_events(conn, store) == 1
+    assert cluster.cluster_new_events(conn, store) == 0
+    ids = dict(conn.execute("SELECT event_uid, incident_id FROM events").fetchall())
+    assert ids == {"a": "a", "b": "a"}
@@ -0,0 +1,110 @@
+from radar import daemon
+from radar.sources import Item
+import ingest
+
+
+def test_adapt_interval_bounds():
+    assert daemon.adapt_interval(100, 3, 60, 600) == 60
+    assert daemon.adapt_interval(500, 0, 60, 600) == 600
+    assert daemon.adapt_interval(200, 0, 60, 600) == 300
+
+
+def test_scheduler_polls_due_feeds_and_adapts():
+    now = [0.0]
+    published = {"busy": ["a"], "quiet": ["x"]}
+    polled = []
+
+    def poll(feed):
+        polled.append(feed.url)
+        return published[feed.url]
+
+    sched = daemon.Scheduler(
+        [daemon.Feed("rss", "busy", 120), daemon.Feed("rss", "quiet", 120)],
+        poll,
+        min_interval=30,
+        max_interval=1000,
+        clock=lambda: now[0],
+    )
+    assert sched.run_once() == 2
+    assert sched.run_once() == 0
+
+    now[0] = 60.0
+    published["busy"] = ["a", "b"]
+    sched.trigger()
+    sched.run_once()
+    busy, quiet = sched.feeds
+    assert busy.last_new == 1 and quiet.last_new == 0
+    assert busy.interval < quiet.interval
+    assert polled == ["busy", "quiet", "busy", "quiet"]
+
+
+def test_trigger_server_round_trip():
+    sched = daemon.Scheduler([daemon.Feed("rss", "u", 100, next_run=1e12)], lambda f: [])
+    httpd = daemon.start_trigger_server(sched, "127.0.0.1", 0)
+    try:
+        assert daemon.request_trigger("127.0.0.1", httpd.server_address[1])
+        assert sched.feeds[0].next_run == 0.0
+    finally:
+        httpd.shutdown()
+
+
+def test_poll_feed_processes_only_unseen_items(monkeypatch):
+    published = [Item("s", "a", "http://x/a", "", None), Item("s", "b", "http://x/b", "", None)]
+    processed = []
+
+    def fake_process(items, *_args, **_kwargs):
+        processed.append([item.link for item in items])
+        return []
+
+    monkeypatch.setattr(ingest, "pull_feed", lambda *_args, **_kwargs: iter(published))
+    monkeypatch.setattr(ingest, "process_items", fake_process)
+    feed = daemon.Feed("rss", "u", 60)
+    feed.seen = set(ingest.poll_feed(feed, {}))
+    published.append(Item("s", "c", "http://x/c", "", None))
+    feed.seen = set(ingest.poll_feed(feed, {}))
+    ingest.poll_feed(feed, {})
+    assert processed == [["http://x/a", "http://x/b"], ["http://x/c"], []]
+    assert len(feed.seen) == 3
+
+
+def test_scheduler_runs_tasks_on_their_own_interval():
+    now = [0.0]
+    runs = []
+    sched = daemon.Scheduler([daemon.Feed("rss", "u", 1000)], lambda f: [], clock=lambda: now[0])
+    sched.every(100, lambda: runs.append(now[0]))
+    sched.run_once()
+    assert runs == [] and sched.seconds_until_next() == 100
+    now[0] = 100.0
+    sched.run_once()
+    assert runs == [100.0]
+
+
+def test_failed_poll_keeps_seen_items(monkeypatch):
+    published = [Item("s", "a", "http://x/a", "", None), Item("s", "b", "http://x/b", "", None)]
+    processed = []
+
+    def fake_process(items, *_args, **_kwargs):
+        processed.extend(item.link for item in items)
+        return []
+
+    monkeypatch.setattr(ingest, "process_items", fake_process)
+
+    def dropped(*_args, **_kwargs):
+        yield published[0]
+        raise ConnectionError("reset")
+
+    monkeypatch.setattr(ingest, "pull_feed", lambda *_args, **_kwargs: iter(published))
+    sched = daemon.Scheduler([daemon.Feed("rss", "u", 60)], lambda f: ingest.poll_feed(f, {}), min_interval=1)
+    sched.run_once(now=0)
+    feed = sched.feeds[0]
+    assert processed == ["http://x/a", "http://x/b"] and len(feed.seen) == 2
+
+    monkeypatch.setattr(ingest, "pull_feed", lambda *_args, **_kwargs: iter([]))  # fetch error swallowed
+    sched.run_once(now=1e9)
+    monkeypatch.setattr(ingest, "pull_feed", dropped)  # connection drops mid-stream
+    sched.run_once(now=2e9)
+    assert len(feed.seen) == 2 and feed.last_new == 0
+
+    monkeypatch.setattr(ingest, "pull_feed", lambda *_args, **_kwargs: iter(published))
+    sched.run_once(now=3e9)
+    assert processed == ["http://x/a", "http://x/b"] and feed.last_new == 0
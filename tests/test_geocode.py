@@ -1,3 +1,5 @@
+import pytest
+
 from radar.geocode import GeoCoder
 
 
@@ -23,3 +25,17 @@ def test_geocode_cache(tmp_path, monkeypatch):
     lat2, lon2, _ = gc.geocode("Somewhere")
     assert (lat2, lon2) == (1.0, 2.0)
     assert called["count"] == 0
+
+
+def test_geocode_errors_are_not_cached(tmp_path, monkeypatch):
+    gc = GeoCoder(str(tmp_path / "cache.sqlite"), user_agent="test")
+
+    def down(q):
+        raise TimeoutError
+
+    monkeypatch.setattr(gc.geocoder, "geocode", down)
+    assert gc.geocode("Somewhere") == (None, None, None)
+    with pytest.raises(TimeoutError):
+        gc.geocode("Somewhere", strict=True)
+    monkeypatch.setattr(gc.geocoder, "geocode", lambda q: DummyLocation(1.0, 2.0))
+    assert gc.geocode("Somewhere")[:2] == (1.0, 2.0)
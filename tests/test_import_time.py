@@ -0,0 +1,46 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Generous enough for slow CI runners; a heavy top-level import blows well past it.
+STARTUP_BUDGET_US = 500_000
+HEAVY_MODULES = {"pandas", "numpy", "duckdb", "spacy", "dateparser", "feedparser", "requests", "geopy", "yaml"}
+
+
+def _importtime(code: str) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = line.split("|")
+        if cum.strip().isdigit():
+            cumulative[name.strip()] = int(cum)
+    return cumulative
+
+
+def test_cli_import_skips_heavy_dependencies():
+    timings = _importtime("import ingest")
+    assert not HEAVY_MODULES & timings.keys()
+    assert timings["ingest"] < STARTUP_BUDGET_US
+
+
+def test_help_runs_without_heavy_dependencies():
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "ingest.py", "--help"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "--daemon" in proc.stdout
+    loaded = {line.split("|")[-1].strip() for line in proc.stderr.splitlines() if "|" in line}
+    assert not HEAVY_MODULES & loaded
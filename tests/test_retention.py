@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta, timezone
+
+from radar import retention, store
+
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+def _ev(uid, days_ago):
+    return {"event_uid": uid, "title": uid, "event_time": NOW - timedelta(days=days_ago), "event_type": "fire"}
+
+
+def test_archive_and_query(tmp_path):
+    duck = store.connect_duckdb(str(tmp_path / "events.db"))
+    sqlite_conn = store.connect_sqlite(str(tmp_path / "articles.db"))
+    rows = [_ev("old1", 100), _ev("old2", 40), _ev("new", 1)]
+    store.insert_events(duck, rows)
+    for row in rows:
+        store.upsert_article(sqlite_conn, row["event_uid"], row["title"], "")
+    archive = str(tmp_path / "archive")
+
+    assert retention.archive_events(duck, archive, 30, sqlite_conn, now=NOW) == 2
+    assert retention.archive_events(duck, archive, 30, sqlite_conn, now=NOW) == 0
+    assert [r[0] for r in duck.execute("SELECT event_uid FROM events").fetchall()] == ["new"]
+    assert [r[0] for r in sqlite_conn.execute("SELECT id FROM articles").fetchall()] == ["new"]
+    assert len(retention.partitions(archive)) == 2
+
+    everything = retention.query_events(duck, archive)
+    assert sorted(everything["event_uid"]) == ["new", "old1", "old2"]
+    recent = retention.query_events(duck, archive, start=NOW - timedelta(days=50))
+    assert sorted(recent["event_uid"]) == ["new", "old2"]
+    hot_only = retention.query_events(duck, str(tmp_path / "missing"))
+    assert list(hot_only["event_uid"]) == ["new"]
+
+
+def test_query_skips_partitions_outside_range(tmp_path):
+    duck = store.connect_duckdb(str(tmp_path / "events.db"))
+    store.insert_events(duck, [_ev("new", 1)])
+    bad = tmp_path / "archive" / "event_date=2020-01-01"
+    bad.mkdir(parents=True)
+    (bad / "events_x.parquet").write_bytes(b"not parquet")
+    df = retention.query_events(duck, str(tmp_path / "archive"), start=NOW - timedelta(days=7))
+    assert list(df["event_uid"]) == ["new"]
+
+
+def test_rearchiving_is_idempotent(tmp_path):
+    duck = store.connect_duckdb(str(tmp_path / "events.db"))
+    archive = str(tmp_path / "archive")
+    store.insert_events(duck, [_ev("old", 40), _ev("new", 1)])
+    assert retention.archive_events(duck, archive, 30, now=NOW) == 1
+
+    # a feed re-publishes the archived item
+    assert store.insert_events(duck, [_ev("old", 40), _ev("newer", 0)]) == ["newer"]
+    assert retention.archive_events(duck, archive, 30, now=NOW) == 0
+    assert sorted(retention.query_events(duck, archive)["event_uid"]) == ["new", "newer", "old"]
+
+
+def test_query_reads_partitions_with_different_schemas(tmp_path):
+    duck = store.connect_duckdb(str(tmp_path / "events.db"))
+    archive = str(tmp_path / "archive")
+    store.insert_events(duck, [_ev("old1", 100)])
+    retention.archive_events(duck, archive, 30, now=NOW)
+    duck.execute("ALTER TABLE events ADD COLUMN severity INTEGER")
+    store.insert_events(duck, [_ev("old2", 40)])
+    retention.archive_events(duck, archive, 30, now=NOW)
+
+    df = retention.archived_events(duck, archive)
+    assert sorted(df["event_uid"]) == ["old1", "old2"]
+    assert "severity" in df.columns
+
+
+def test_vacuum_only_when_fragmented(tmp_path):
+    sqlite_conn = store.connect_sqlite(str(tmp_path / "articles.db"))
+    for n in range(500):
+        store.upsert_article(sqlite_conn, f"id{n}", "title", "x" * 500)
+    assert not retention.vacuum_if_fragmented(sqlite_conn, 0.25)
+    sqlite_conn.execute("DELETE FROM articles WHERE id != 'id0'")
+    sqlite_conn.commit()
+    assert retention.vacuum_if_fragmented(sqlite_conn, 0.25)
+    assert not retention.vacuum_if_fragmented(sqlite_conn, 0.25)
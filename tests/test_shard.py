@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from radar import shard
+from radar.sources import Item
+import ingest
+
+T0 = datetime(2024, 6, 1, tzinfo=timezone.utc)
+RUN = datetime(2024, 6, 3, tzinfo=timezone.utc)  # shared fallback time for undated items
+
+
+def _events():
+    rows = []
+    for i in range(12):
+        rows.append(
+            {
+                "event_uid": f"u{i % 10}",  # u0/u1 appear in two feeds
+                "source": f"feed{i % 4}",
+                "title": f"t{i}",
+                "link": f"l{i % 10}",
+                "event_time": T0 + timedelta(hours=i) if i < 10 else RUN,  # u0/u1 copies are undated
+                "lat": 1.0,
+                "lon": 2.0,
+                "event_type": "fire",
+                "simhash": 2**63 + (i % 5),  # near-duplicate wording
+            }
+        )
+    return rows
+
+
+def _run(tmp_path, count):
+    staging = tmp_path / f"staging{count}"
+    for index in range(count):
+        mine = [r for r in _events() if shard.shard_of(r["source"], count) == index]
+        shard.write_staging(mine, shard.staging_path(str(staging), index, count))
+    return shard.merge_events(shard.read_staging(shard.staged_files(str(staging))))
+
+
+def test_select_shard_partitions_sources():
+    specs = [("rss", f"https://example.com/{i}", {}) for i in range(20)]
+    parts = [shard.select_shard(specs, i, 3) for i in range(3)]
+    assert sorted(s for p in parts for s in p) == sorted(specs)
+
+
+def test_merge_is_independent_of_shard_count(tmp_path):
+    one, three, four = _run(tmp_path, 1), _run(tmp_path, 3), _run(tmp_path, 4)
+    assert one == three == four
+    assert len({r["event_uid"] for r in one}) == len(one)
+    assert [r["simhash"] for r in one] == [2**63 + i for i in range(5)]
+
+
+def test_undated_items_use_the_run_time():
+    item = Item("feed", "Fire", "http://x/1", "", None, lat=1.0, lon=2.0)  # pre-geocoded: no download
+    assert ingest.extract_stage(item, default_time=RUN)["event_time"] == RUN
+
+
+def test_staged_files_requires_every_shard(tmp_path):
+    shard.write_staging([], shard.staging_path(str(tmp_path), 0, 2))
+    with pytest.raises(RuntimeError):
+        shard.staged_files(str(tmp_path))
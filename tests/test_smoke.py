@@ -21,3 +21,30 @@ def test_ingest_smoke(tmp_path, monkeypatch):
     ingest.run_pipeline(cfg, dry_run=False, since=None)
     data = json.loads(Path(cfg["geojson_output"]).read_text())
     assert data["features"]
+
+
+def test_ingest_writes_in_batches(tmp_path, monkeypatch):
+    fixtures = Path(__file__).parent / "fixtures"
+    cfg = {
+        "sources": {"rss": [(fixtures / "rss1.xml").as_uri(), (fixtures / "rss2.xml").as_uri()], "json": []},
+        "duckdb_path": str(tmp_path / "events.db"),
+        "sqlite_path": str(tmp_path / "articles.db"),
+        "geocode_cache": str(tmp_path / "geocode.sqlite"),
+        "geojson_output": str(tmp_path / "events.geojson"),
+        "csv_output": str(tmp_path / "events.csv"),
+        "write_batch_size": 1,
+    }
+    monkeypatch.setattr(sources, "fetch_article_html", lambda url: "")
+    monkeypatch.setattr(geocode.GeoCoder, "geocode", lambda self, text, strict=False: (0.0, 0.0, 1.0))
+    monkeypatch.setattr(ingest.dedupe, "_seen", ingest.dedupe.deque())
+    batches = []
+    real_store = ingest.store_events
+
+    def counting_store(cfg, events, stores):
+        batches.append(len(events))
+        real_store(cfg, events, stores)
+
+    monkeypatch.setattr(ingest, "store_events", counting_store)
+    ingest.run_pipeline(cfg, dry_run=False, since=None)
+    assert batches and set(batches) == {1}
+    assert len(json.loads(Path(cfg["geojson_output"]).read_text())["features"]) == len(batches)
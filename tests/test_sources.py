@@ -0,0 +1,121 @@
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+import requests
+
+from radar import sources
+
+
+class FakeResponse:
+    def __init__(self, body, links=None):
+        self.raw = io.BytesIO(json.dumps(body).encode())
+        self.links = links or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+
+def _serve(monkeypatch, pages):
+    calls = []
+
+    def fake_get(url, params=None, **_kwargs):
+        calls.append((url, params))
+        key = url if params is None else (url, params["offset"])
+        return FakeResponse(*pages[key])
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    return calls
+
+
+def test_iter_json_follows_next_links(monkeypatch):
+    _serve(
+        monkeypatch,
+        {
+            "http://x/feed": ({"items": [{"title": "a", "link": "l1"}], "next": "/feed?page=2"},),
+            "http://x/feed?page=2": ([{"title": "b", "link": "l2", "published": "2024-05-01T10:00:00Z"}],),
+        },
+    )
+    items = list(sources.iter_json("http://x/feed"))
+    assert [i.title for i in items] == ["a", "b"]
+    assert items[1].published == datetime(2024, 5, 1, 10, tzinfo=timezone.utc)
+    assert items[0].published is None
+
+
+def test_iter_json_field_mapping_and_offset_paging(monkeypatch):
+    record = {
+        "properties": {"callsign": "ABC1", "ts": 1714557600},
+        "geometry": {"coordinates": [-0.12, 51.5]},
+    }
+    calls = _serve(
+        monkeypatch,
+        {
+            ("http://x/flights", 0): ({"data": [record, record]},),
+            ("http://x/flights", 2): ({"data": [record]},),
+        },
+    )
+    items = sources.fetch_json(
+        "http://x/flights",
+        items_path="data.item",
+        fields={
+            "title": "properties.callsign",
+            "time": "properties.ts",
+            "lat": "geometry.coordinates.1",
+            "lon": "geometry.coordinates.0",
+        },
+        offset_param="offset",
+        page_size=2,
+    )
+    assert len(items) == 3 and len(calls) == 2
+    assert (items[0].title, items[0].lat, items[0].lon) == ("ABC1", 51.5, -0.12)
+    assert items[0].published == datetime(2024, 5, 1, 10, tzinfo=timezone.utc)
+
+
+def test_iter_json_swallows_http_errors(monkeypatch):
+    def boom(*_args, **_kwargs):
+        raise requests.ConnectionError
+
+    monkeypatch.setattr(requests, "get", boom)
+    assert sources.fetch_json("http://x/down") == []
+
+
+class DroppedResponse(FakeResponse):
+    """Serves the first part of the body, then the connection drops."""
+
+    def __init__(self, body):
+        super().__init__(body)
+        data = self.raw.getvalue()
+        self.raw = io.BufferedReader(_Truncated(data[: len(data) // 2]))
+
+
+class _Truncated(io.RawIOBase):
+    def __init__(self, data):
+        self.data = data
+
+    def readable(self):
+        return True
+
+    def readinto(self, buf):
+        if not self.data:
+            raise requests.ConnectionError("connection reset")
+        n = min(len(buf), len(self.data))
+        buf[:n], self.data = self.data[:n], self.data[n:]
+        return n
+
+
+def test_iter_json_reports_truncated_page(monkeypatch, capsys):
+    body = [{"title": f"t{n}", "link": f"l{n}"} for n in range(5000)]
+    monkeypatch.setattr(requests, "get", lambda *_args, **_kwargs: DroppedResponse(body))
+    items = sources.fetch_json("http://x/big")
+    assert 0 < len(items) < 5000
+    assert "http://x/big at page 1" in capsys.readouterr().out
+    monkeypatch.setattr(requests, "get", lambda *_args, **_kwargs: DroppedResponse(body))
+    with pytest.raises(requests.ConnectionError):
+        sources.fetch_json("http://x/big", strict=True)
@@ -0,0 +1,72 @@
+from radar import extract, sources
+from radar.sources import Item
+from radar.textcache import TextCache, normalize_url
+import ingest
+
+
+def test_normalize_url():
+    assert normalize_url("HTTPS://News.Example.com:443/a/b/?utm_source=x&b=2&a=1#frag") == (
+        "https://news.example.com/a/b?a=1&b=2"
+    )
+    assert normalize_url("http://example.com") == "http://example.com/"
+
+
+def test_cache_shares_content_and_fetches_once(tmp_path):
+    cache = TextCache(str(tmp_path))
+    calls = []
+
+    def fetch(url):
+        calls.append(url)
+        return "body text"
+
+    assert cache.get_or_fetch("https://a.com/x?utm_medium=rss", fetch) == "body text"
+    assert cache.get_or_fetch("https://a.com/x", fetch) == "body text"
+    cache.put("https://b.com/mirror", "body text")
+    assert calls == ["https://a.com/x?utm_medium=rss"]
+    assert cache.total_bytes() == len("body text")
+    assert cache.get_or_fetch("https://c.com/down", lambda url: "") == ""
+    assert cache.get("https://c.com/down") is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = TextCache(str(tmp_path), max_bytes=10)
+    cache.put("https://a.com/1", "aaaaa")
+    cache.put("https://a.com/2", "bbbbb")
+    cache.get("https://a.com/1")
+    cache.put("https://a.com/3", "ccccc")
+    assert cache.get("https://a.com/2") is None
+    assert cache.get("https://a.com/1") == "aaaaa"
+    assert cache.total_bytes() <= 10
+
+
+def test_tiered_extraction_skips_article_when_summary_has_location(monkeypatch):
+    fetched = []
+
+    def fetch(url):
+        fetched.append(url)
+        return ""
+
+    monkeypatch.setattr(sources, "fetch_article_html", fetch)
+    monkeypatch.setattr(
+        extract, "extract_locations", lambda text, title="": [extract.Candidate("Leeds")] if "Leeds" in text else []
+    )
+    clear = Item("s", "Fire", "http://x/1", "Fire in Leeds", None)
+    vague = Item("s", "Fire", "http://x/2", "Fire downtown", None)
+    assert ingest.extract_stage(clear, tiered=True)["location_text"] == "Leeds"
+    ingest.extract_stage(vague, tiered=True)
+    assert fetched == ["http://x/2"]
+
+
+def test_put_sums_sizes_only_when_eviction_is_due(tmp_path, monkeypatch):
+    cache = TextCache(str(tmp_path), max_bytes=10)
+    sums = []
+    real_total = cache.total_bytes
+    monkeypatch.setattr(cache, "total_bytes", lambda: sums.append(1) or real_total())
+    cache.put("https://a.com/1", "aaaa")
+    cache.put("https://a.com/1?utm_source=x", "aaaa")
+    cache.put("https://a.com/2", "bbbb")
+    assert sums == []
+    cache.put("https://a.com/3", "cccc")
+    assert len(sums) == 1
+    assert cache.get("https://a.com/1") is None
+    assert real_total() == 8
@@ -0,0 +1,158 @@
+import json
+import sys
+import types
+from datetime import datetime, timezone
+from pathlib import Path
+
+from radar import geocode, sources
+from radar.sources import Item
+from radar.workqueue import WorkQueue
+import ingest
+
+
+def _item(n):
+    return Item("src", f"title {n}", f"http://x/{n}", "summary", datetime(2024, 1, n, tzinfo=timezone.utc))
+
+
+def test_queue_checkpoints_and_parks(tmp_path):
+    path = str(tmp_path / "queue.sqlite")
+    q = WorkQueue(path, max_attempts=2, backoff_seconds=10)
+    assert q.enqueue([("a", _item(1)), ("b", _item(2))]) == 2
+    assert q.enqueue([("a", _item(1))]) == 0
+    q.advance("a", "extracted", {"event_time": datetime(2024, 1, 1, tzinfo=timezone.utc)})
+    q.close()
+
+    q = WorkQueue(path, max_attempts=2, backoff_seconds=10)
+    due = {uid: (item, stage, result) for uid, item, stage, result in q.due()}
+    assert due["a"][1] == "extracted"
+    assert due["a"][2]["event_time"] == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert due["b"][0] == _item(2)
+
+    assert q.fail("b", "boom", now=1000) == "pending"
+    assert [uid for uid, *_ in q.due(now=1005)] == ["a"]
+    assert "b" in [uid for uid, *_ in q.due(now=1011)]
+    assert q.fail("b", "boom again", now=1011) == "parked"
+    assert q.parked() == [("b", "boom again")]
+    q.finish(["a"])
+    assert list(q.due(now=1e12)) == []
+    assert q.counts() == {"done": 1, "parked": 1}
+
+
+def test_interrupted_run_resumes(tmp_path, monkeypatch):
+    fixtures = Path(__file__).parent / "fixtures"
+    cfg = {}
+    queue = WorkQueue(str(tmp_path / "queue.sqlite"), backoff_seconds=0)
+    items = list(sources.fetch_rss([(fixtures / "rss1.xml").as_uri()]))
+    queue.enqueue((ingest._event_uid(item), item) for item in items)
+    monkeypatch.setattr(sources, "fetch_article_html", lambda url, strict=False: "")
+    monkeypatch.setattr(ingest.geocode.time, "sleep", lambda _s: None)
+    fetches = []
+    real_extract = ingest.extract_stage
+
+    def counting_extract(item, *args, **kwargs):
+        fetches.append(item.link)
+        return real_extract(item, *args, **kwargs)
+
+    monkeypatch.setattr(ingest, "extract_stage", counting_extract)
+    gc = geocode.GeoCoder(str(tmp_path / "geocode.sqlite"))
+
+    def down(query):
+        raise TimeoutError("geocoder timeout")
+
+    monkeypatch.setattr(gc.geocoder, "geocode", down)
+    assert ingest.process_queue(queue, cfg, None, geocoder=gc) == ([], [])
+    assert len(fetches) == len(items)
+    assert queue.counts() == {"pending": len(items)}
+    assert gc.conn.execute("SELECT COUNT(*) FROM geocache").fetchone()[0] == 0  # failure not cached
+
+    monkeypatch.setattr(gc.geocoder, "geocode", lambda query: None)
+    uids, events = ingest.process_queue(queue, cfg, None, geocoder=gc)
+    assert len(fetches) == len(items)  # resumed from the extracted stage, no re-download
+    assert len(events) == len(items)
+    queue.finish(uids)
+    assert queue.counts() == {"done": len(items)}
+
+
+def test_since_holds_items_and_duplicates_are_claimed(tmp_path, monkeypatch):
+    fixtures = Path(__file__).parent / "fixtures"
+    cfg = {
+        "sources": {"rss": [(fixtures / "rss1.xml").as_uri(), (fixtures / "rss2.xml").as_uri()], "json": []},
+        "duckdb_path": str(tmp_path / "events.db"),
+        "sqlite_path": str(tmp_path / "articles.db"),
+        "geocode_cache": str(tmp_path / "geocode.sqlite"),
+        "geojson_output": str(tmp_path / "events.geojson"),
+        "csv_output": str(tmp_path / "events.csv"),
+        "work_queue": {"path": str(tmp_path / "queue.sqlite")},
+    }
+    monkeypatch.setattr(sources, "fetch_article_html", lambda url, strict=False: "")
+    monkeypatch.setattr(geocode.GeoCoder, "geocode", lambda self, text, strict=False: (1.0, 2.0, 1.0))
+    ingest.run_pipeline(cfg, dry_run=False, since=datetime(2025, 1, 1, tzinfo=timezone.utc))
+    assert WorkQueue(cfg["work_queue"]["path"]).counts() == {"held": 2}
+
+    ingest.run_pipeline(cfg, dry_run=False, since=None)
+    assert WorkQueue(cfg["work_queue"]["path"]).counts() == {"done": 2}
+    assert len(json.loads(Path(cfg["geojson_output"]).read_text())["features"]) == 2
+
+    q = WorkQueue(cfg["work_queue"]["path"])
+    q.enqueue([("copy", _item(1))])
+    assert q.claim("copy", 42, now=1000) is None
+    assert q.claim("copy", 42, now=1001) is None  # re-claiming its own hash is fine
+    q.enqueue([("repost", _item(2))])
+    assert q.claim("repost", 42, now=1002) == "copy"
+    assert q.claim("repost", 42, now=1000 + 25 * 3600) is None  # outside the window
+
+
+def test_dead_article_link_falls_back_to_summary(tmp_path, monkeypatch):
+    status = {"code": 404}
+    fake = types.ModuleType("trafilatura")
+    fake.fetch_response = lambda url, decode=True: types.SimpleNamespace(status=status["code"], html=None)
+    fake.extract = lambda html: None
+    monkeypatch.setitem(sys.modules, "trafilatura", fake)
+    monkeypatch.setattr(ingest.geocode.time, "sleep", lambda _s: None)
+    cfg = {"extraction": {"tiered": True}}
+    gc = geocode.GeoCoder(str(tmp_path / "geocode.sqlite"))
+    queue = WorkQueue(str(tmp_path / "queue.sqlite"), backoff_seconds=0)
+    dead = Item("src", "Fire", "http://x/gone", "a fire broke out overnight", None)
+    queue.enqueue([("dead", dead)])
+    uids, events = ingest.process_queue(queue, cfg, None, geocoder=gc)
+    assert uids == ["dead"] and events[0]["title"] == "Fire"
+    queue.finish(uids)
+
+    status["code"] = 503
+    queue.enqueue([("busy", Item("src", "Crash", "http://x/busy", "a crash on the ring road", None))])
+    assert ingest.process_queue(queue, cfg, None, geocoder=gc) == ([], [])
+    assert "503" in dict(queue.conn.execute("SELECT uid, error FROM work_items").fetchall())["busy"]
+
+
+def test_held_items_are_pruned_and_writes_are_batched(tmp_path, monkeypatch):
+    q = WorkQueue(str(tmp_path / "queue.sqlite"))
+    q.enqueue([("old", _item(1))])
+    q.advance("old", "extracted", {})
+    q.hold("old")
+    q.conn.execute("UPDATE work_items SET updated = 0")
+    q.hold("old")  # holding again does not reset its age
+    assert q.prune(keep_days=7) == 1
+
+    fixtures = Path(__file__).parent / "fixtures"
+    cfg = {
+        "sources": {"rss": [(fixtures / "rss1.xml").as_uri(), (fixtures / "rss2.xml").as_uri()], "json": []},
+        "duckdb_path": str(tmp_path / "events.db"),
+        "sqlite_path": str(tmp_path / "articles.db"),
+        "geocode_cache": str(tmp_path / "geocode.sqlite"),
+        "geojson_output": str(tmp_path / "events.geojson"),
+        "csv_output": str(tmp_path / "events.csv"),
+        "work_queue": {"path": str(tmp_path / "queue2.sqlite")},
+        "write_batch_size": 1,
+    }
+    monkeypatch.setattr(sources, "fetch_article_html", lambda url, strict=False: "")
+    monkeypatch.setattr(geocode.GeoCoder, "geocode", lambda self, text, strict=False: (1.0, 2.0, 1.0))
+    finished = []
+    real_finish = WorkQueue.finish
+
+    def recording_finish(self, uids):
+        finished.append(list(uids))
+        real_finish(self, finished[-1])
+
+    monkeypatch.setattr(WorkQueue, "finish", recording_finish)
+    ingest.run_pipeline(cfg, dry_run=False, since=None)
+    assert [len(batch) for batch in finished] == [1, 1]